@@ -30,7 +30,7 @@ try:
                        sequence_manipulation as sm,
                        iterables_manipulation as im,
                        multiprocessing_operations as mo)
-    from utils.parameters_validation import get_blast_version
+    from utils.parameters_validation import get_blast_version, read_gene_list
 except ModuleNotFoundError:
     from CHEWBBACA.utils import (constants as ct,
                                  blast_wrapper as bw,
@@ -42,7 +42,7 @@ except ModuleNotFoundError:
                                  sequence_manipulation as sm,
                                  iterables_manipulation as im,
                                  multiprocessing_operations as mo)
-    from CHEWBBACA.utils.parameters_validation import get_blast_version
+    from CHEWBBACA.utils.parameters_validation import get_blast_version, read_gene_list
 
 
 def compute_loci_modes(loci_files, output_file):
@@ -1798,30 +1798,30 @@ def select_representatives(representative_candidates, locus, fasta_file,
         ids_file = binary_file
 
     # BLASTp to compare all candidates
-    blast_output = fo.join_paths(output_directory,
-                                 ['{0}_candidates_{1}_blastout.tsv'.format(locus, iteration)])
+    # Read results from the BLAST stdout, they are only used here
     # Define -max_target_seqs to reduce execution time
-    blastp_std = bw.run_blast(blastp_path, blast_db, fasta_file,
-                              blast_output, threads=threads,
-                              ids_file=ids_file, max_targets=100)
-
-    blast_results = fo.read_tabular(blast_output)
-    # Get self-score for all candidates
-    candidates_self_scores = {line[0]: ((int(line[3])*3)+3, float(line[6]))
-                              for line in blast_results if line[0] == line[4]}
-    # Select results between different candidates
-    blast_results = [line for line in blast_results if line[0] != line[4]]
-
-    # Compute BSR
+    blast_results = bw.run_blast(blastp_path, blast_db, fasta_file,
+                                 None, threads=threads,
+                                 ids_file=ids_file, max_targets=100,
+                                 stream=True)
+    # Get self-score for all candidates and keep the fields needed
+    # from the results between different candidates
+    candidates_self_scores = {}
+    candidates_hits = []
     for line in blast_results:
-        line.append(cf.compute_bsr(float(line[6]), candidates_self_scores[line[0]][1]))
+        if line[0] == line[4]:
+            candidates_self_scores[line[0]] = float(line[6])
+        else:
+            candidates_hits.append((line[0], line[4], int(line[3]), float(line[6])))
+
     # Sort by sequence length to process longest candidates first
-    blast_results = sorted(blast_results, key=lambda x: int(x[3]))
+    candidates_hits.sort(key=lambda x: x[2])
 
     excluded_candidates = set()
-    for r in blast_results:
-        if r[7] >= blast_score_ratio+0.1 and r[0] not in excluded_candidates:
-            excluded_candidates.add(r[4])
+    for query, subject, _, raw_score in candidates_hits:
+        bsr = cf.compute_bsr(raw_score, candidates_self_scores[query])
+        if bsr >= blast_score_ratio+0.1 and query not in excluded_candidates:
+            excluded_candidates.add(subject)
 
     selected_candidates = set(representative_candidates.keys()) - excluded_candidates
 
@@ -2713,7 +2713,7 @@ def allele_calling(fasta_files, schema_directory, temp_directory,
 
             # This includes self-score for candidates that are not added
             # (e.g. classification changes due to multiple matches)
-            self_scores = {**self_scores, **new_self_scores}
+            self_scores.update(new_self_scores)
 
         iteration += 1
 
@@ -2753,8 +2753,8 @@ def main(input_file, loci_list, schema_directory, output_directory,
     print('Number of inputs: {0}'.format(len(input_files)))
 
     # Get list of loci in the schema
-    schema_loci = fo.pickle_loader(fo.join_paths(schema_directory,
-                                                 [ct.GENE_LIST_BASENAME]))
+    schema_loci = read_gene_list(fo.join_paths(schema_directory,
+                                               [ct.GENE_LIST_BASENAME]))
     schema_loci_paths = [fo.join_paths(schema_directory, [file])
                             for file in schema_loci]
 
@@ -820,7 +820,7 @@ def main(schema_directory, cpu_cores, nomenclature_server,
 
     # Get schema files from genes list file
     genes_list = fo.join_paths(schema_directory, [ct.GENE_LIST_BASENAME])
-    genes = fo.pickle_loader(genes_list)
+    genes = pv.read_gene_list(genes_list)
 
     # update loci structure
     not_in_ns, pickled_loci, rearranged = update_loci_files(loci_alleles, genes,
@@ -932,7 +932,7 @@ def main(schema_directory, species_id, schema_name, loci_prefix,
 
     # Get schema files from genes list file
     genes_list = fo.join_paths(schema_directory, [ct.GENE_LIST_BASENAME])
-    genes = fo.pickle_loader(genes_list)
+    genes = pv.read_gene_list(genes_list)
     fasta_paths = [os.path.join(schema_directory, file) for file in genes]
     fasta_paths.sort()
 
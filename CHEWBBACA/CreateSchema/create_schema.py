@@ -68,8 +68,8 @@ def create_schema_structure(schema_seed_fasta, output_directory, schema_name):
     fo.create_directory(schema_dir)
 
     # add allele identifier to all sequences
-    schema_records = {im.replace_multiple_characters(rec.id, ct.CHAR_REPLACEMENTS): str(rec.seq)
-                      for rec in fao.sequence_generator(schema_seed_fasta)}
+    schema_records = {im.replace_multiple_characters(seqid, ct.CHAR_REPLACEMENTS): sequence
+                      for seqid, sequence in fao.sequence_tuples(schema_seed_fasta)}
 
     loci_basenames = {k: k+'.fasta' for k in schema_records}
     loci_paths = {k: fo.join_paths(schema_dir, [v])
@@ -85,11 +85,39 @@ def create_schema_structure(schema_seed_fasta, output_directory, schema_name):
     return loci_paths
 
 
+def bsr_excluded_from_files(blast_files, sequence_lengths, blast_score_ratio):
+    """Determine the sequences to exclude based on the BSR in BLAST files.
+
+    Parameters
+    ----------
+    blast_files : list
+        List with paths to files with BLAST results in
+        tabular format.
+    sequence_lengths : dict
+        Dictionary with sequence identifiers as keys
+        and DNA sequence lengths as values.
+    blast_score_ratio : float
+        The BSR value to use as threshold.
+
+    Returns
+    -------
+    excluded : list
+        List with the identifiers of the sequences that
+        were highly similar to other sequences.
+    """
+    excluded = [sm.apply_bsr(fo.read_tabular(file),
+                             sequence_lengths,
+                             blast_score_ratio)
+                for file in blast_files]
+
+    return im.flatten_list(excluded)
+
+
 def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
                        blast_score_ratio, minimum_length, translation_table,
                        size_threshold, word_size, window_size, clustering_sim,
                        representative_filter, intra_filter, cpu_cores, blast_path,
-                       prodigal_mode, cds_input):
+                       prodigal_mode, cds_input, aligner='blast'):
     """Create a schema seed based on a set of input FASTA files."""
     # Map full paths to unique identifier (prefix before first '.')
     full_to_basename = im.mapping_function(fasta_files, fo.file_basename, [False])
@@ -153,7 +181,7 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
         failed = []
         # Cannot get CDS coordinates if skipping gene prediction
         cds_coordinates = None
-        total_cdss = sum([r[1] for r in renaming_results])
+        total_cdss = sum(r[1] for r in renaming_results)
         print('Input files contain a total of {total_cdss} coding sequences.')
 
     if len(failed) > 0:
@@ -209,6 +237,8 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
 
     # Index FASTA file with distinct DNA sequences
     dna_index = fao.index_fasta(distinct_file)
+    # Get DNA sequence lengths once to compute BSR values
+    dna_lengths = fao.sequence_lengths(distinct_file)
 
     # Translate CDSs
     print(f'\n {ct.CDS_TRANSLATION} ')
@@ -248,8 +278,8 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
 
     print(f'Identified {len(representative_pseqids)} distinct proteins.')
 
-    # Sort remaining seqids
-    schema_seqids = im.sort_iterable(representative_pseqids, sort_key=lambda x: x.lower())
+    # Keep remaining seqids in a set to exclude sequences in the next steps
+    schema_seqids = set(representative_pseqids)
     print(f'Kept {len(schema_seqids)} sequences after filtering the initial sequences.')
 
     # Protein clustering
@@ -287,7 +317,7 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
     print(f'Remaining sequences after representative and singleton pruning: {clustered_sequences}')
 
     # Remove excluded seqids
-    schema_seqids = list(set(schema_seqids) - excluded_seqids)
+    schema_seqids -= excluded_seqids
 
     # Exclude based on high similarity to other clustered sequences
     intra_filter_dir = fo.join_paths(clustering_dir, ['intracluster_filter'])
@@ -301,7 +331,7 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
 
     # Remove excluded seqids - we get set of sequences from clusters
     # plus singletons
-    schema_seqids = list(set(schema_seqids) - set(intra_excluded))
+    schema_seqids.difference_update(intra_excluded)
 
     # Define BLASTp and makeblastdb paths
     blastp_path = fo.join_paths(blast_path, [ct.BLASTP_ALIAS])
@@ -326,14 +356,19 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
 
         # Compute and exclude based on BSR
         print('\nRemoving sequences based on high BSR...')
-        bsr_excluded = [sm.apply_bsr(fo.read_tabular(file),
-                                     dna_index,
-                                     blast_score_ratio)
-                        for file in blast_files]
+        bsr_inputs = im.divide_list_into_n_chunks(blast_files, cpu_cores)
+        bsr_inputs = [[files] for files in bsr_inputs]
+        bsr_inputs = im.multiprocessing_inputs(bsr_inputs,
+                                               [dna_lengths, blast_score_ratio],
+                                               bsr_excluded_from_files)
+        bsr_excluded = mo.map_async_parallelizer(bsr_inputs,
+                                                 mo.function_helper,
+                                                 cpu_cores,
+                                                 show_progress=False)
 
         # Merge BSR results
         bsr_excluded = set(im.flatten_list(bsr_excluded))
-        schema_seqids = list(set(schema_seqids) - bsr_excluded)
+        schema_seqids -= bsr_excluded
         print(f'Removed {len(bsr_excluded)} sequences.')
 
         # Write list of excluded to file
@@ -346,7 +381,7 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
     print(f'{len(schema_seqids)} sequences to compare in final BLASTp.'.format(len(schema_seqids)))
 
     # Sort seqids before final BLASTp to ensure consistent results
-    schema_seqids = im.sort_iterable(schema_seqids, sort_key=lambda x: x.lower())
+    schema_seqids = im.sort_iterable(schema_seqids, sort_key=str.lower)
 
     # Create directory for final BLASTp
     final_blast_dir = fo.join_paths(temp_directory, ['4_final_blast'])
@@ -356,41 +391,54 @@ def create_schema_seed(fasta_files, output_directory, schema_name, ptf_path,
     quasi_schema_file = os.path.join(final_blast_dir, 'remaining_sequences.fasta')
     fao.get_sequences_by_id(proteins, schema_seqids, quasi_schema_file)
 
-    # Create BLASTp database
-    blast_db = fo.join_paths(final_blast_dir, ['remaining_sequences'])
-    db_std = bw.make_blast_db(makeblastdb_path, quasi_schema_file, blast_db, 'prot')
-
-    # Divide FASTA file into groups of 100 sequences to reduce
-    # execution time for large sequence sets
-    split_dir = fo.join_paths(final_blast_dir, ['cds_subsets'])
-    fo.create_directory(split_dir)
-    splitted_fastas = fao.split_seqcount(quasi_schema_file, split_dir, 100)
-
-    # Create directory to store results from final BLASTp
-    final_blastp_dir = fo.join_paths(final_blast_dir, ['BLAST_results'])
-    fo.create_directory(final_blastp_dir)
-    blast_outputs = ['{0}/{1}_blast_out.tsv'.format(final_blastp_dir,
-                                                    fo.file_basename(i[0], False))
-                     for i in splitted_fastas]
-
-    # Add common arguments to all sublists
-    blast_inputs = [[blastp_path, blast_db, file[0],
-                     blast_outputs[i], 1, 1, bw.run_blast]
-                    for i, file in enumerate(splitted_fastas)]
-
-    print('Performing final BLASTp...')
-    blast_results = mo.map_async_parallelizer(blast_inputs,
-                                              mo.function_helper,
-                                              cpu_cores,
-                                              show_progress=True)
-
-    # Concatenate files with BLASTp results
     blast_output = fo.join_paths(final_blast_dir, ['blast_out_concat.tsv'])
-    blast_output = fo.concatenate_files(blast_outputs, blast_output)
+    if aligner == 'diamond':
+        # DIAMOND is multithreaded and has a high startup cost
+        # Align all sequences in a single run
+        diamond_db = fo.join_paths(final_blast_dir, ['remaining_sequences'])
+        db_std = bw.make_diamond_db(ct.DIAMOND_ALIAS, quasi_schema_file,
+                                    diamond_db, cpu_cores)
+        print('Performing final BLASTp with DIAMOND...')
+        diamond_std = bw.run_diamond(ct.DIAMOND_ALIAS, diamond_db,
+                                     quasi_schema_file, blast_output,
+                                     threads=cpu_cores)
+    else:
+        # Create BLASTp database
+        blast_db = fo.join_paths(final_blast_dir, ['remaining_sequences'])
+        db_std = bw.make_blast_db(makeblastdb_path, quasi_schema_file, blast_db, 'prot')
+
+        # Divide FASTA file into groups of 100 sequences to reduce
+        # execution time for large sequence sets
+        split_dir = fo.join_paths(final_blast_dir, ['cds_subsets'])
+        fo.create_directory(split_dir)
+        splitted_fastas = fao.split_seqcount(quasi_schema_file, split_dir, 100)
+
+        # Create directory to store results from final BLASTp
+        final_blastp_dir = fo.join_paths(final_blast_dir, ['BLAST_results'])
+        fo.create_directory(final_blastp_dir)
+        blast_outputs = ['{0}/{1}_blast_out.tsv'.format(final_blastp_dir,
+                                                        fo.file_basename(i[0], False))
+                         for i in splitted_fastas]
+
+        # Add common arguments to all sublists
+        blast_inputs = [[blastp_path, blast_db, file[0],
+                         blast_outputs[i], 1, 1, bw.run_blast]
+                        for i, file in enumerate(splitted_fastas)]
+
+        print('Performing final BLASTp...')
+        blast_results = mo.map_async_parallelizer(blast_inputs,
+                                                  mo.function_helper,
+                                                  cpu_cores,
+                                                  show_progress=True)
+
+        # Concatenate files with BLASTp results
+        blast_output = fo.concatenate_files(blast_outputs, blast_output)
     final_excluded = sm.apply_bsr(fo.read_tabular(blast_output),
-                                  dna_index,
+                                  dna_lengths,
                                   blast_score_ratio)
-    schema_seqids = list(set(schema_seqids) - set(final_excluded))
+    # Keep sorted order to write representatives in a consistent order
+    final_excluded = set(final_excluded)
+    schema_seqids = [seqid for seqid in schema_seqids if seqid not in final_excluded]
     print(f'\nRemoved {len(final_excluded)} sequences highly similar to other sequences.')
 
     # Create file with the schema representative sequences
@@ -424,7 +472,7 @@ def main(input_files, output_directory, schema_name, ptf_path,
          blast_score_ratio, minimum_length, translation_table,
          size_threshold, word_size, window_size, clustering_sim,
          representative_filter, intra_filter, cpu_cores, blast_path,
-         cds_input, prodigal_mode, no_cleanup):
+         cds_input, prodigal_mode, no_cleanup, aligner='blast'):
     """Create a wgMLST schema seed.
 
     Parameters
@@ -480,6 +528,9 @@ def main(input_files, output_directory, schema_name, ptf_path,
     no_cleanup : bool
         If provided, intermediate files generated during process
         execution are not removed at the end.
+    aligner : str
+        Software used to perform the final all-vs-all alignment
+        ("blast" or "diamond").
     """
     print(f'Prodigal training file: {ptf_path}')
     print(f'Prodigal mode: {prodigal_mode}')
@@ -493,6 +544,7 @@ def main(input_files, output_directory, schema_name, ptf_path,
     print(f'Clustering similarity: {clustering_sim}')
     print(f'Representative filter: {representative_filter}')
     print(f'Intra-cluster filter: {intra_filter}')
+    print(f'Aligner: {aligner}')
 
     if prodigal_mode == 'meta' and ptf_path is not None:
         print('Prodigal mode is set to "meta". Will add training file to '
@@ -504,14 +556,14 @@ def main(input_files, output_directory, schema_name, ptf_path,
     input_files = fo.read_lines(input_files, strip=True)
 
     # Sort paths to FASTA files
-    input_files = im.sort_iterable(input_files, sort_key=lambda x: x.lower())
+    input_files = im.sort_iterable(input_files, sort_key=str.lower)
 
     results = create_schema_seed(input_files, output_directory, schema_name,
                                  ptf_path, blast_score_ratio, minimum_length,
                                  translation_table, size_threshold, word_size,
                                  window_size, clustering_sim, representative_filter,
                                  intra_filter, cpu_cores, blast_path,
-                                 prodigal_mode, cds_input)
+                                 prodigal_mode, cds_input, aligner)
 
     # Remove temporary files
     if no_cleanup is False:
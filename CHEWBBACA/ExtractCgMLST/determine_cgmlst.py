@@ -255,8 +255,9 @@ def main(input_file, output_directory, threshold, step,
     fo.create_directory(output_directory)
 
     # import matrix with allelic profiles
+    # Read all values as strings to skip per-column type inference
     matrix = pd.read_csv(input_file, header=0, index_col=0,
-                         sep='\t', low_memory=False)
+                         sep='\t', dtype=str, engine='c')
 
     total_genomes, total_loci = matrix.shape
     print('Input matrix has {0} profiles for {1} '
@@ -287,7 +288,8 @@ def main(input_file, output_directory, threshold, step,
     # mask missing data
     print('Masking matrix with {0} profiles for {1} '
           'loci...'.format(total_genomes, total_loci))
-    masked_matrix = matrix.apply(im.replace_chars)
+    # Replace values in the whole dataframe instead of column by column
+    masked_matrix = im.replace_chars(matrix)
     print('Masked {0} profiles.'.format(total_genomes))
 
     # build presence/absence matrix
@@ -12,157 +12,175 @@ line and calls the specified module.
 
 import os
 import sys
-import shutil
 import hashlib
 import argparse
+import importlib
+import importlib.util
+from collections import namedtuple
+
+
+# Options that print the version or the list of modules
+VERSION_TRIGGERS = frozenset(['-v', '--v', '-version', '--version'])
+HELP_TRIGGERS = frozenset(['-h', '--h', '-help', '--help'])
 
 try:
 	from __init__ import __version__
-	from AlleleCall import allele_call
-	from CreateSchema import create_schema
-	from SchemaEvaluator import evaluate_schema
-	from AlleleCallEvaluator import evaluate_calls
-	from PrepExternalSchema import adapt_schema
-	from UniprotFinder import annotate_schema
-	from ExtractCgMLST import determine_cgmlst
-	from utils import (join_profiles,
-					   remove_genes,
-					   # profiles_sqlitedb as ps,
-					   process_datetime as pdt,
-					   constants as ct,
-					   parameters_validation as pv,
-					   file_operations as fo)
-
-	from utils.parameters_validation import ModifiedHelpFormatter
-
-	from CHEWBBACA_NS import (download_schema, upload_schema,
-							  synchronize_schema, stats_requests)
+	from utils import (process_datetime as pdt,
+					   constants as ct)
+
+	MODULE_PREFIX = ''
 except ModuleNotFoundError:
 	from CHEWBBACA import __version__
-	from CHEWBBACA.AlleleCall import allele_call
-	from CHEWBBACA.CreateSchema import create_schema
-	from CHEWBBACA.SchemaEvaluator import evaluate_schema
-	from CHEWBBACA.AlleleCallEvaluator import evaluate_calls
-	from CHEWBBACA.PrepExternalSchema import adapt_schema
-	from CHEWBBACA.UniprotFinder import annotate_schema
-	from CHEWBBACA.ExtractCgMLST import determine_cgmlst
-	from CHEWBBACA.utils import (join_profiles,
-								 remove_genes,
-								 # profiles_sqlitedb as ps,
-								 process_datetime as pdt,
-								 constants as ct,
-								 parameters_validation as pv,
-								 file_operations as fo)
-
-	from CHEWBBACA.utils.parameters_validation import ModifiedHelpFormatter
-
-	from CHEWBBACA.CHEWBBACA_NS import (download_schema, upload_schema,
-										synchronize_schema, stats_requests)
-
-
-version = __version__
-
+	from CHEWBBACA.utils import (process_datetime as pdt,
+								 constants as ct)
 
-@pdt.process_timer
-def run_create_schema():
-	"""Run the CreateSchema module to create a schema seed."""
+	MODULE_PREFIX = 'CHEWBBACA.'
 
-	def msg(name=None):
-		# simple command to create schema from genomes
-		simple_cmd = ('chewBBACA.py CreateSchema -i <input_files> '
-						'-o <output_directory> --ptf <ptf_path>')
-		# command to create schema from genomes with non-default parameters
-		params_cmd = ('chewBBACA.py CreateSchema -i <input_files> '
-						'-o <output_directory> --ptf <ptf_path>\n'
-						'\t\t\t    --cpu <cpu_cores> --bsr <blast_score_ratio> '
-						'--l <minimum_length>\n\t\t\t    --t <translation_table> '
-						'--st <size_threshold>')
-		# command to create schema from FASTA with coding sequences
-		cds_cmd = ('chewBBACA.py CreateSchema -i <input_files> '
-					'-o <output_directory> --ptf <ptf_path> '
-					'--cds')
-
-		usage_msg = ('\nCreate schema from genome assemblies:\n  {0}\n'
-						'\nCreate schema with non-default parameters:\n  {1}\n'
-						'\nCreate schema from FASTA files with coding sequences:\n  {2}'.format(simple_cmd, params_cmd, cds_cmd))
-
-		return usage_msg
 
-	parser = argparse.ArgumentParser(prog='CreateSchema',
-										description='Creates a schema seed based on a '
-													'set of FASTA files with genome '
-													'assemblies or coding sequences.',
-										usage=msg(),
-										formatter_class=ModifiedHelpFormatter,
-										epilog='It is strongly advised to provide a training file to '
-											'create a schema. Module documentation available at '
-											'https://chewbbaca.readthedocs.io/en/latest/user/modules/CreateSchema.html')
+version = __version__
 
-	parser.add_argument('CreateSchema', nargs='+', help='')
 
+def load_module(module_name):
+	"""Import the module that implements a subcommand.
+
+	Subcommand modules are only imported when the subcommand
+	runs so that the CLI does not load the dependencies of every
+	module at startup.
+
+	Parameters
+	----------
+	module_name : str
+		Module name relative to the chewBBACA package
+		(e.g. 'AlleleCall.allele_call').
+
+	Returns
+	-------
+	module
+		The imported module.
+	"""
+	return importlib.import_module(f'{MODULE_PREFIX}{module_name}')
+
+
+def lazy_module(module_name):
+	"""Import a module that is only executed when first used.
+
+	Printing the version or the list of modules does not need
+	the modules that validate arguments and their dependencies
+	(Biopython, NumPy).
+
+	Parameters
+	----------
+	module_name : str
+		Module name relative to the chewBBACA package
+		(e.g. 'utils.parameters_validation').
+
+	Returns
+	-------
+	module
+		Module that is executed on first attribute access.
+	"""
+	full_name = f'{MODULE_PREFIX}{module_name}'
+	if full_name in sys.modules:
+		return sys.modules[full_name]
+
+	spec = importlib.util.find_spec(full_name)
+	loader = importlib.util.LazyLoader(spec.loader)
+	spec.loader = loader
+	module = importlib.util.module_from_spec(spec)
+	sys.modules[full_name] = module
+	loader.exec_module(module)
+
+	return module
+
+
+pv = lazy_module('utils.parameters_validation')
+fo = lazy_module('utils.file_operations')
+
+# Modules that implement each subcommand, available as attributes
+# of this module for callers that used to import them from here
+SUBCOMMAND_MODULES = {'create_schema': 'CreateSchema.create_schema',
+					  'allele_call': 'AlleleCall.allele_call',
+					  'evaluate_schema': 'SchemaEvaluator.evaluate_schema',
+					  'evaluate_calls': 'AlleleCallEvaluator.evaluate_calls',
+					  'determine_cgmlst': 'ExtractCgMLST.determine_cgmlst',
+					  'remove_genes': 'utils.remove_genes',
+					  'join_profiles': 'utils.join_profiles',
+					  'adapt_schema': 'PrepExternalSchema.adapt_schema',
+					  'annotate_schema': 'UniprotFinder.annotate_schema',
+					  'download_schema': 'CHEWBBACA_NS.download_schema',
+					  'upload_schema': 'CHEWBBACA_NS.upload_schema',
+					  'synchronize_schema': 'CHEWBBACA_NS.synchronize_schema',
+					  'stats_requests': 'CHEWBBACA_NS.stats_requests'}
+
+
+def __getattr__(name):
+	"""Import subcommand modules on first attribute access (PEP 562)."""
+	if name in SUBCOMMAND_MODULES:
+		module = load_module(SUBCOMMAND_MODULES[name])
+		# Store in the module namespace so later lookups skip this function
+		globals()[name] = module
+		return module
+	elif name == 'ModifiedHelpFormatter':
+		return pv.ModifiedHelpFormatter
+
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def add_shared_arguments(parser, help_texts):
+	"""Add the arguments shared by CreateSchema and AlleleCall to a parser.
+
+	Parameters
+	----------
+	parser : argparse.ArgumentParser
+		Parser of the CreateSchema or AlleleCall module.
+	help_texts : dict
+		Help message of the module for each argument whose
+		description differs between modules, indexed by the
+		argument destination.
+
+	Returns
+	-------
+	parser : argparse.ArgumentParser
+		Input parser with the shared arguments.
+	"""
 	parser.add_argument('-i', '--input-files', nargs='?', type=str,
 						required=True, dest='input_files',
-						help='Path to the directory that contains the input '
-								'FASTA files. Alternatively, a file with '
-								'a list of full paths to FASTA files, one per line.')
-
-	parser.add_argument('-o', '--output-directory', type=str,
-						required=True, dest='output_directory',
-						help='Output directory where the process will store '
-								'intermediate files and create the schema\'s '
-								'directory.')
-
-	parser.add_argument('--n', '--schema-name', type=str,
-						required=False, default='schema_seed',
-						dest='schema_name',
-						help='Name given to the folder that will store the '
-								'schema files.')
+						help=help_texts['input_files'])
 
 	parser.add_argument('--ptf', '--training-file', type=str,
 						required=False, dest='ptf_path',
-						help='Path to the Prodigal training file.')
+						help=help_texts['ptf_path'])
 
 	parser.add_argument('--bsr', '--blast-score-ratio', type=pv.bsr_type,
-						required=False, default=ct.DEFAULT_BSR,
-						dest='blast_score_ratio',
+						required=False, dest='blast_score_ratio',
 						help='BLAST Score Ratio value. Sequences with '
 								'alignments with a BSR value equal to or '
 								'greater than this value will be considered '
 								'as sequences from the same gene.')
 
 	parser.add_argument('--l', '--minimum-length', type=pv.minimum_sequence_length_type,
-						required=False, default=201, dest='minimum_length',
-						help='Minimum sequence length value. Coding sequences '
-								'shorter than this value are excluded.')
+						required=False, dest='minimum_length',
+						help=help_texts['minimum_length'])
 
 	parser.add_argument('--t', '--translation-table', type=pv.translation_table_type,
-						required=False, default=11, dest='translation_table',
-						help='Genetic code used to predict genes and'
-								' to translate coding sequences.')
+						required=False, dest='translation_table',
+						help=help_texts['translation_table'])
 
 	parser.add_argument('--st', '--size-threshold', type=pv.size_threshold_type,
-						required=False, default=0.2, dest='size_threshold',
-						help='CDS size variation threshold. Added to the '
-								'schema\'s config file and used to identify '
-								'alleles with a length value that deviates from '
-								'the locus length mode during the allele calling '
-								'process.')
+						required=False, dest='size_threshold',
+						help=help_texts['size_threshold'])
 
 	parser.add_argument('--cpu', '--cpu-cores', type=pv.verify_cpu_usage,
 						required=False, default=1, dest='cpu_cores',
-						help='Number of CPU cores that will be '
-								'used to run the process '
-								'(will be redefined to a lower value '
-								'if it is equal to or exceeds the total'
-								'number of available CPU cores).')
+						help=help_texts['cpu_cores'])
 
 	parser.add_argument('--b', '--blast-path', type=pv.check_blast,
 						required=False, default='', dest='blast_path',
 						help='Path to the directory that contains the '
 								'BLAST executables.')
 
-	parser.add_argument('--pm', '--prodigal-mode', required=False,
-						choices=['single', 'meta'],
+	parser.add_argument('--pm', '--prodigal-mode', type=str,
+						required=False, choices=['single', 'meta'],
 						default='single', dest='prodigal_mode',
 						help='Prodigal running mode ("single" for '
 								'finished genomes, reasonable quality '
@@ -171,11 +189,77 @@ def run_create_schema():
 								'genomes, small viruses, and small '
 								'plasmids).')
 
-	parser.add_argument('--cds', '--cds-input', required=False,
-						action='store_true', dest='cds_input',
-						help='If provided, chewBBACA skips the gene '
-								'prediction step and assumes the input FASTA '
-								'files contain coding sequences.')
+	parser.add_argument('--cds', '--cds-input', action='store_true',
+						required=False, dest='cds_input',
+						help=help_texts['cds_input'])
+
+	return parser
+
+
+CREATE_SCHEMA_USAGE = ('\nCreate schema from genome assemblies:\n'
+					   '  chewBBACA.py CreateSchema -i <input_files> -o <output_directory> --ptf <ptf_path>\n'
+					   '\nCreate schema with non-default parameters:\n'
+					   '  chewBBACA.py CreateSchema -i <input_files> -o <output_directory> --ptf <ptf_path>\n'
+					   '\t\t\t    --cpu <cpu_cores> --bsr <blast_score_ratio> --l <minimum_length>\n'
+					   '\t\t\t    --t <translation_table> --st <size_threshold>\n'
+					   '\nCreate schema from FASTA files with coding sequences:\n'
+					   '  chewBBACA.py CreateSchema -i <input_files> -o <output_directory> --ptf <ptf_path> --cds')
+
+
+@pdt.process_timer
+def run_create_schema():
+	"""Run the CreateSchema module to create a schema seed."""
+
+	parser = argparse.ArgumentParser(prog='CreateSchema',
+										description='Creates a schema seed based on a '
+													'set of FASTA files with genome '
+													'assemblies or coding sequences.',
+										usage=CREATE_SCHEMA_USAGE,
+										formatter_class=pv.ModifiedHelpFormatter,
+										epilog='It is strongly advised to provide a training file to '
+											'create a schema. Module documentation available at '
+											'https://chewbbaca.readthedocs.io/en/latest/user/modules/CreateSchema.html')
+
+	add_shared_arguments(parser, {
+		'input_files': 'Path to the directory that contains the input '
+						'FASTA files. Alternatively, a file with '
+						'a list of full paths to FASTA files, one per line.',
+		'ptf_path': 'Path to the Prodigal training file.',
+		'minimum_length': 'Minimum sequence length value. Coding sequences '
+							'shorter than this value are excluded.',
+		'translation_table': 'Genetic code used to predict genes and'
+								' to translate coding sequences.',
+		'size_threshold': 'CDS size variation threshold. Added to the '
+							'schema\'s config file and used to identify '
+							'alleles with a length value that deviates from '
+							'the locus length mode during the allele calling '
+							'process.',
+		'cpu_cores': 'Number of CPU cores that will be '
+						'used to run the process '
+						'(will be redefined to a lower value '
+						'if it is equal to or exceeds the total'
+						'number of available CPU cores).',
+		'cds_input': 'If provided, chewBBACA skips the gene '
+						'prediction step and assumes the input FASTA '
+						'files contain coding sequences.'})
+
+	parser.add_argument('-o', '--output-directory', type=str,
+						required=True, dest='output_directory',
+						help='Output directory where the process will store '
+								'intermediate files and create the schema\'s '
+								'directory.')
+
+	parser.add_argument('--n', '--schema-name', type=str,
+						required=False, default='schema_seed',
+						dest='schema_name',
+						help='Name given to the folder that will store the '
+								'schema files.')
+
+	# Schema creation requires values for all parameters
+	parser.set_defaults(blast_score_ratio=ct.DEFAULT_BSR,
+						minimum_length=ct.MINIMUM_LENGTH_DEFAULT,
+						translation_table=11,
+						size_threshold=ct.SIZE_THRESHOLD_DEFAULT)
 
 	parser.add_argument('--no-cleanup', required=False, action='store_true',
 						dest='no_cleanup',
@@ -183,14 +267,25 @@ def run_create_schema():
 							 'during process execution are not deleted at '
 							 'the end.')
 
-	args = parser.parse_args()
-	del args.CreateSchema
+	parser.add_argument('--aligner', type=str, required=False,
+						choices=ct.ALIGNERS, default='blast', dest='aligner',
+						help='Software used to perform the final all-vs-all '
+							 'alignment ("blast" for BLASTp, "diamond" for '
+							 'DIAMOND in sensitive mode). DIAMOND is faster '
+							 'for large sets of sequences, but might not find '
+							 'all alignments found by BLASTp.')
+
+	args = parser.parse_args(sys.argv[2:])
 
 	# Check if PTF exists
 	if args.ptf_path is not None:
 		if os.path.isfile(args.ptf_path) is False:
 			sys.exit(ct.INVALID_PTF_PATH)
 
+	# Check if DIAMOND is installed
+	if args.aligner == 'diamond' and ct.DIAMOND_ALIAS is None:
+		sys.exit(ct.DIAMOND_NO_PATH)
+
 	# Create output directory
 	created = fo.create_directory(args.output_directory)
 	if created is False:
@@ -198,12 +293,9 @@ def run_create_schema():
 
 	genome_list = fo.join_paths(args.output_directory, [ct.GENOME_LIST])
 	args.input_files = pv.check_input_type(args.input_files, genome_list)
-	# Detect if some inputs share the same unique prefix
-	repeated_prefixes = pv.check_unique_prefixes(args.input_files)
-	# Detect if filenames include blank spaces
-	blank_spaces = pv.check_blanks(args.input_files)
-	# Check if any input file has an unique prefix >= 50 characters
-	long_prefixes = pv.check_prefix_length(args.input_files)
+	# Detect if some inputs share the same unique prefix, if filenames
+	# include blank spaces or if any unique prefix is too long
+	pv.validate_input_list(args.input_files)
 
 	# Add clustering parameters
 	args.word_size = ct.WORD_SIZE_DEFAULT
@@ -213,15 +305,15 @@ def run_create_schema():
 	args.intra_filter = ct.INTRA_CLUSTER_DEFAULT
 
 	# Run the CreateSchema process
+	create_schema = load_module(SUBCOMMAND_MODULES['create_schema'])
 	create_schema.main(**vars(args))
 
 	schema_dir = os.path.join(args.output_directory, args.schema_name)
 	# Copy Prodigal Training File (PTF) to schema directory
 	ptf_hash = None
 	if args.ptf_path is not None:
-		shutil.copy(args.ptf_path, schema_dir)
-		# Determine PTF checksum
-		ptf_hash = fo.hash_file(args.ptf_path, hashlib.blake2b())
+		# Copy PTF and determine its checksum in a single pass
+		ptf_hash = fo.hash_and_copy_file(args.ptf_path, schema_dir, hashlib.blake2b())
 
 	# Write schema config file
 	args.minimum_length = ct.MSL_MIN
@@ -235,56 +327,59 @@ def run_create_schema():
 	fo.remove_files([genome_list])
 
 
+ALLELE_CALL_USAGE = ('\nPerform allele calling with schema default parameters:\n'
+					 '  chewBBACA.py AlleleCall -i <input_files> -g <schema_directory> -o <output_directory> \n'
+					 '\nPerform allele calling with non-default parameters:\n'
+					 '  chewBBACA.py AlleleCall -i <input_files> -g <schema_directory> -o <output_directory> --cpu <cpu_cores> \n'
+					 '\t\t\t  --bsr <blast_score_ratio> --l <minimum_length>\n'
+					 '\t\t\t  --t <translation_table> --st <size_threshold>\n'
+					 '\nPerform allele calling with FASTA files that contain CDSs:\n'
+					 '  chewBBACA.py AlleleCall -i <input_files> -g <schema_directory> -o <output_directory> --cds')
+
+
 @pdt.process_timer
 def run_allele_call():
 	"""Run the AlleleCall module to perform allele calling."""
 
-	def msg(name=None):
-		# simple command to perform AlleleCall with schema default parameters
-		simple_cmd = ('chewBBACA.py AlleleCall -i <input_files> '
-						'-g <schema_directory> '
-						'-o <output_directory> ')
-		# command to perform AlleleCall with non-default parameters
-		params_cmd = ('chewBBACA.py AlleleCall -i <input_files> '
-						'-g <schema_directory> '
-						'-o <output_directory> '
-						'--cpu <cpu_cores> '
-						'\n\t\t\t  --bsr <blast_score_ratio> '
-						'--l <minimum_length>\n'
-						'\t\t\t  --t <translation_table> '
-						'--st <size_threshold>')
-		# command to perform AlleleCall with Fasta files that contain CDS
-		cds_cmd = ('chewBBACA.py AlleleCall -i <input_files> '
-											'-g <schema_directory> '
-											'-o <output_directory> '
-											'--cds')
-
-		usage_msg = ('\nPerform allele calling with schema default parameters:\n  {0}\n'
-						'\nPerform allele calling with non-default parameters:\n  {1}\n'
-						'\nPerform allele calling with FASTA files that contain CDSs:\n  {2}'.format(simple_cmd, params_cmd, cds_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='AlleleCall',
 										description='Performs allele calling to determine the '
 													'allelic profiles of a set of samples in FASTA format. '
 													'The process identifies new alleles, assigns '
 													'an integer identifier to those alleles and '
 													'adds them to the schema.',
-										usage=msg(),
-										formatter_class=ModifiedHelpFormatter,
+										usage=ALLELE_CALL_USAGE,
+										formatter_class=pv.ModifiedHelpFormatter,
 										epilog='It is strongly advised to perform allele calling '
 											'with the default schema parameters to ensure '
 											'more consistent results. Module documentation available at '
 											'https://chewbbaca.readthedocs.io/en/latest/user/modules/AlleleCall.html')
 
-	parser.add_argument('AlleleCall', nargs='+', help='')
-
-	parser.add_argument('-i', '--input-files', nargs='?', type=str,
-						required=True, dest='input_files',
-						help='Path to the directory with the genome FASTA '
-								'files or to a file that contains a list of full paths to '
-								'the FASTA files, one per line.')
+	add_shared_arguments(parser, {
+		'input_files': 'Path to the directory with the genome FASTA '
+						'files or to a file that contains a list of full paths to '
+						'the FASTA files, one per line.',
+		'ptf_path': 'Path to the Prodigal training file. Default is '
+					'to get the training file from the schema\'s '
+					'directory',
+		'minimum_length': 'Minimum sequence length accepted for a '
+							'coding sequence to be included in the schema.',
+		'translation_table': 'Genetic code used to predict genes and'
+								' to translate coding sequences. Must match '
+								'the genetic code used to create the training '
+								'file.',
+		'size_threshold': 'CDS size variation threshold. At the default '
+							'value of 0.2, alleles with size that deviates '
+							'+-20 percent from the locus length mode will be '
+							'classified as ASM/ALM',
+		'cpu_cores': 'Number of CPU cores/threads that will be '
+						'used to run the process '
+						'(will be redefined to a lower value '
+						'if it is equal to or exceeds the total'
+						'number of available CPU cores/threads).',
+		'cds_input': 'Input files contain coding sequences (one '
+						'Fasta file per strain). chewBBACA skips the '
+						'gene prediction step with Prodigal if this '
+						'argument is provided.'})
 
 	parser.add_argument('-g', '--schema-directory', type=str,
 						required=True, dest='schema_directory',
@@ -301,74 +396,12 @@ def run_allele_call():
 								'subdirectory named "results_<TIMESTAMP>" '
 								'if the path passed by the user already exists).')
 
-	parser.add_argument('--ptf', '--training-file', type=str,
-						required=False, dest='ptf_path',
-						help='Path to the Prodigal training file. Default is '
-								'to get the training file from the schema\'s '
-								'directory')
-
 	parser.add_argument('--gl', '--genes-list', type=str,
 						required=False, default=False, dest='genes_list',
 						help='Path to a file that contains the list of full paths '
 								'to the loci FASTA files or loci IDs, one per line, '
 								'the process should use to perform allele calling.')
 
-	parser.add_argument('--bsr', '--blast-score-ratio', type=pv.bsr_type,
-						required=False, dest='blast_score_ratio',
-						help='BLAST Score Ratio value. Sequences with '
-								'alignments with a BSR value equal to or '
-								'greater than this value will be considered '
-								'as sequences from the same gene.')
-
-	parser.add_argument('--l', '--minimum-length', type=pv.minimum_sequence_length_type,
-						required=False, dest='minimum_length',
-						help='Minimum sequence length accepted for a '
-								'coding sequence to be included in the schema.')
-
-	parser.add_argument('--t', '--translation-table', type=pv.translation_table_type,
-						required=False, dest='translation_table',
-						help='Genetic code used to predict genes and'
-								' to translate coding sequences. Must match '
-								'the genetic code used to create the training '
-								'file.')
-
-	parser.add_argument('--st', '--size-threshold', type=pv.size_threshold_type,
-						required=False, dest='size_threshold',
-						help='CDS size variation threshold. At the default '
-								'value of 0.2, alleles with size that deviates '
-								'+-20 percent from the locus length mode will be '
-								'classified as ASM/ALM')
-
-	parser.add_argument('--cpu', '--cpu-cores', type=pv.verify_cpu_usage,
-						required=False, default=1, dest='cpu_cores',
-						help='Number of CPU cores/threads that will be '
-								'used to run the process '
-								'(will be redefined to a lower value '
-								'if it is equal to or exceeds the total'
-								'number of available CPU cores/threads).')
-
-	parser.add_argument('--b', '--blast-path', type=pv.check_blast,
-						required=False, default='', dest='blast_path',
-						help='Path to the directory that contains the '
-								'BLAST executables.')
-
-	parser.add_argument('--pm', '--prodigal-mode', type=str,
-						required=False, choices=['single', 'meta'],
-						default='single', dest='prodigal_mode',
-						help='Prodigal running mode ("single" for '
-								'finished genomes, reasonable quality '
-								'draft genomes and big viruses. "meta" '
-								'for metagenomes, low quality draft '
-								'genomes, small viruses, and small '
-								'plasmids).')
-
-	parser.add_argument('--cds', '--cds-input', action='store_true',
-						required=False, dest='cds_input',
-						help='Input files contain coding sequences (one '
-								'Fasta file per strain). chewBBACA skips the '
-								'gene prediction step with Prodigal if this '
-								'argument is provided.')
-
 	parser.add_argument('--no-inferred', required=False,
 						action='store_true', dest='no_inferred',
 						help='If provided, the process will not add '
@@ -440,7 +473,7 @@ def run_allele_call():
 								'BSR value, including the determination of new '
 								'representative alleles to add to the schema).')
 
-	args = parser.parse_args()
+	args = parser.parse_args(sys.argv[2:])
 
 	# Check if input schema path exists
 	if not os.path.exists(args.schema_directory):
@@ -458,12 +491,21 @@ def run_allele_call():
 	if os.path.isfile(config_file) is False:
 		sys.exit(ct.ADAPT_LEGACY_SCHEMA)
 	else:
-		schema_params = fo.pickle_loader(config_file)
-		# Chek if user provided different values
-		run_params = pv.solve_conflicting_arguments(schema_params, args.ptf_path,
-													args.blast_score_ratio, args.translation_table,
-													args.minimum_length, args.size_threshold,
-													args.force_continue, config_file, args.schema_directory)
+		# Reuse values validated by a previous run with the same arguments
+		cache_key = pv.arguments_cache_key(args.schema_directory, config_file,
+										   args.ptf_path, args.blast_score_ratio,
+										   args.translation_table, args.minimum_length,
+										   args.size_threshold)
+		run_params = pv.read_arguments_cache(args.schema_directory, cache_key,
+											 args.ptf_path)
+		if run_params is None:
+			schema_params = fo.pickle_loader(config_file)
+			# Chek if user provided different values
+			run_params = pv.solve_conflicting_arguments(schema_params, args.ptf_path,
+														args.blast_score_ratio, args.translation_table,
+														args.minimum_length, args.size_threshold,
+														args.force_continue, config_file, args.schema_directory)
+			pv.write_arguments_cache(cache_key, run_params)
 		args.ptf_path = run_params['ptf_path']
 		args.blast_score_ratio = run_params['bsr']
 		args.translation_table = run_params['translation_table']
@@ -495,12 +537,9 @@ def run_allele_call():
 
 	genome_list = fo.join_paths(args.output_directory, [ct.GENOME_LIST])
 	genome_list = pv.check_input_type(args.input_files, genome_list)
-	# Detect if some inputs share the same unique prefix
-	repeated_prefixes = pv.check_unique_prefixes(genome_list)
-	# Detect if filenames include blank spaces
-	blank_spaces = pv.check_blanks(genome_list)
-	# Check if any input file has an unique prefix >= 50 characters
-	long_prefixes = pv.check_prefix_length(genome_list)
+	# Detect if some inputs share the same unique prefix, if filenames
+	# include blank spaces or if any unique prefix is too long
+	pv.validate_input_list(genome_list)
 
 	# Determine if schema was downloaded from Chewie-NS
 	ns_config = fo.join_paths(args.schema_directory, ['.ns_config'])
@@ -526,6 +565,7 @@ def run_allele_call():
 				'Prodigal mode': args.prodigal_mode,
 				'Mode': args.mode}
 
+	allele_call = load_module(SUBCOMMAND_MODULES['allele_call'])
 	allele_call.main(genome_list, loci_list, args.schema_directory,
 						args.output_directory, args.no_inferred,
 						args.output_unclassified, args.output_missing,
@@ -540,20 +580,14 @@ def run_allele_call():
 	fo.remove_files([genome_list])
 
 
+SCHEMA_EVALUATOR_USAGE = ('\nEvaluate schema with default parameters:\n'
+						  '  chewBBACA.py SchemaEvaluator -g <schema_directory> -o <output_directory> --cpu <cpu_cores> --loci-reports\n')
+
+
 @pdt.process_timer
 def run_evaluate_schema():
 	"""Run the SchemaEvaluator module to evaluate a typing schema."""
 
-	def msg(name=None):
-		# simple command to evaluate schema or set of loci
-		simple_cmd = ('chewBBACA.py SchemaEvaluator -g <schema_directory> '
-					  '-o <output_directory> --cpu <cpu_cores> --loci-reports')
-
-		usage_msg = (
-			'\nEvaluate schema with default parameters:\n  {0}\n'.format(simple_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='SchemaEvaluator',
 									 description='Evaluate the number of alelles and allele size '
 												 'variation for the loci in a schema or for a set '
@@ -562,10 +596,8 @@ def run_evaluate_schema():
 												 'for each locus with a plot with allele size, a Neighbor '
 												 'Joining tree based on a multiple sequence alignment (MSA) '
 												 'and a visualization of the MSA.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('SchemaEvaluator', nargs='+', help='')
+									 usage=SCHEMA_EVALUATOR_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-g', '--schema-directory', type=str, required=True,
 						dest='schema_directory',
@@ -632,8 +664,7 @@ def run_evaluate_schema():
 							 'is in readonly mode (allows to search for '
 							 'and copy text).')
 
-	args = parser.parse_args()
-	del args.SchemaEvaluator
+	args = parser.parse_args(sys.argv[2:])
 
 	# Check if input schema path exists
 	if not os.path.exists(args.schema_directory):
@@ -655,32 +686,25 @@ def run_evaluate_schema():
 
 	args.genes_list = loci_list
 
+	evaluate_schema = load_module(SUBCOMMAND_MODULES['evaluate_schema'])
 	evaluate_schema.main(**vars(args))
 
 	# Delete file with list of loci that were evaluated
 	fo.remove_files([loci_list])
 
 
+ALLELECALL_EVALUATOR_USAGE = ('\nAnalyse allele calling results with default parameters:\n'
+							  '  chewBBACA.py AlleleCallEvaluator -i <input_files> -g <schema_directory> -o <output_directory>\n')
+
+
 @pdt.process_timer
 def run_evaluate_calls():
 	"""Run the AlleleCallEvaluator module to evaluate allele calling results."""
 
-	def msg(name=None):
-		# simple command to analyse allele calling results
-		simple_cmd = ('chewBBACA.py AlleleCallEvaluator -i <input_files> '
-					  '-g <schema_directory> -o <output_directory>')
-
-		usage_msg = (
-			'\nAnalyse allele calling results with default parameters:\n  {0}\n'.format(simple_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='AlleleCallEvaluator',
 									 description='Evaluates allele calling results.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('AlleleCallEvaluator', nargs='+', help='')
+									 usage=ALLELECALL_EVALUATOR_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-i', '--input-files', type=str, required=True,
 						dest='input_files',
@@ -731,8 +755,7 @@ def run_evaluate_calls():
 						help='Compute the MSA of the core genome loci, even '
 							 'if `--no-tree` is provided.')
 
-	args = parser.parse_args()
-	del args.AlleleCallEvaluator
+	args = parser.parse_args(sys.argv[2:])
 
 	# Check if path to input files exists
 	if not os.path.exists(args.input_files):
@@ -743,44 +766,30 @@ def run_evaluate_calls():
 	if created is False:
 		sys.exit(ct.OUTPUT_DIRECTORY_EXISTS)
 
+	evaluate_calls = load_module(SUBCOMMAND_MODULES['evaluate_calls'])
 	evaluate_calls.main(**vars(args))
 
 
+EXTRACT_CGMLST_USAGE = ('\nDetermine cgMLST:\n'
+						'  chewBBACA.py ExtractCgMLST -i <input_file> -o <output_directory> \n'
+						'\nDetermine cgMLST based on non-default threshold:\n'
+						'  chewBBACA.py ExtractCgMLST -i <input_file> -o <output_directory> \n'
+						'\t\t\t     --t <threshold>\n'
+						'\nRemove genes and genomes from matrix:\n'
+						'  chewBBACA.py ExtractCgMLST -i <input_file> -o <output_directory> \n'
+						'\t\t\t     --r <genes2remove> --g <genomes2remove>\n')
+
+
 @pdt.process_timer
 def run_determine_cgmlst():
 	"""Run the ExtractCgMLST module to determine the core-genome."""
 
-	def msg(name=None):
-		# simple command to determine loci that constitute cgMLST
-		simple_cmd = ('  chewBBACA.py ExtractCgMLST -i <input_file> '
-					  '-o <output_directory> ')
-
-		# command to determine cgMLST with custom threshold
-		threshold_cmd = ('  chewBBACA.py ExtractCgMLST -i <input_file> '
-						 '-o <output_directory> '
-						 '\n\t\t\t     --t <threshold>')
-
-		# command to remove specific genes and genomes from the analysis
-		remove_cmd = ('  chewBBACA.py ExtractCgMLST -i <input_file> '
-					  '-o <output_directory> '
-					  '\n\t\t\t     --r <genes2remove> '
-					  '--g <genomes2remove>')
-
-		usage_msg = ('\nDetermine cgMLST:\n{0}\n'
-					 '\nDetermine cgMLST based on non-default threshold:\n{1}\n'
-					 '\nRemove genes and genomes from matrix:\n{2}\n'
-					 ''.format(simple_cmd, threshold_cmd, remove_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='ExtractCgMLST',
 									 description='Determines the set of '
 												 'loci that constitute the '
 												 'core genome based on loci presence thresholds.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('ExtractCgMLST', nargs='+', help='')
+									 usage=EXTRACT_CGMLST_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-i', '--input-file', type=str,
 						required=True, dest='input_file',
@@ -818,34 +827,24 @@ def run_determine_cgmlst():
 							 'remove from the matrix (one genome identifier '
 							 'per line).')
 
-	args = parser.parse_args()
-	del args.ExtractCgMLST
+	args = parser.parse_args(sys.argv[2:])
 
+	determine_cgmlst = load_module(SUBCOMMAND_MODULES['determine_cgmlst'])
 	determine_cgmlst.main(**vars(args))
 
 
+REMOVE_GENES_USAGE = ('\nRemove a set of genes from a matrix with allelic profiles:\n'
+					  '  chewBBACA.py RemoveGenes -i <input_file> -g <genes_list> -o <output_file>\n')
+
+
 @pdt.process_timer
 def run_remove_genes():
 	"""Run the RemoveGenes module to remove loci from allele calling results."""
 
-	def msg(name=None):
-
-		# simple command to remove a set of genes/columns from a matrix
-		simple_cmd = ('  chewBBACA.py RemoveGenes -i <input_file> '
-					  '-g <genes_list> '
-					  '-o <output_file>')
-
-		usage_msg = (
-			'\nRemove a set of genes from a matrix with allelic profiles:\n{0}\n'.format(simple_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='RemoveGenes',
 									 description='Remove loci from a matrix with allelic profiles.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('RemoveGenes', nargs='+', help='')
+									 usage=REMOVE_GENES_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-i', '--input-file', type=str,
 						required=True, dest='input_file',
@@ -867,33 +866,25 @@ def run_remove_genes():
 							 'genes to keep and all other genes should be '
 							 'removed.')
 
-	args = parser.parse_args()
-	del args.RemoveGenes
+	args = parser.parse_args(sys.argv[2:])
 
+	remove_genes = load_module(SUBCOMMAND_MODULES['remove_genes'])
 	remove_genes.main(**vars(args))
 
 
+JOIN_PROFILES_USAGE = ('\nJoin allele calling results from two runs:\n'
+					   '\n  chewBBACA.py JoinProfiles -p <profiles1> <profiles2> -o <output_file> \n')
+
+
 @pdt.process_timer
 def run_join_profiles():
 	"""Run the JoinProfiles module to join allele calling results."""
 
-	def msg(name=None):
-
-		# simple command to adapt external schema with default arguments values
-		simple_cmd = ('  chewBBACA.py JoinProfiles -p <profiles1> <profiles2> '
-					  '-o <output_file> ')
-
-		usage_msg = ('\nJoin allele calling results from two runs:\n\n{0}\n'.format(simple_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='JoinProfiles',
 									 description='Joins allele calling results from '
 												 'multiple runs.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('JoinProfiles', nargs='+', help='')
+									 usage=JOIN_PROFILES_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-p', '--profiles', nargs='+', type=str,
 						required=True, dest='profiles',
@@ -911,38 +902,24 @@ def run_join_profiles():
 						help='Create file with profiles for the set of '
 							 'common loci.')
 
-	args = parser.parse_args()
-	del args.JoinProfiles
+	args = parser.parse_args(sys.argv[2:])
 
+	join_profiles = load_module(SUBCOMMAND_MODULES['join_profiles'])
 	join_profiles.main(**vars(args))
 
 
+PREP_EXTERNAL_SCHEMA_USAGE = ('\nAdapt external schema (one FASTA file per schema gene):\n'
+							  '\n  chewBBACA.py PrepExternalSchema -g <schema_directory> -o <output_directory> --ptf <ptf_path> \n'
+							  '\nAdapt external schema with non-default parameters:\n'
+							  '\n  chewBBACA.py PrepExternalSchema -g <schema_directory> -o <output_directory> --ptf <ptf_path>\n'
+							  '\t\t\t\t  --cpu <cpu_cores> --bsr <blast_score_ratio> --l <minimum_length>\n'
+							  '\t\t\t\t  --t <translation_table> --st <size_threshold>\n')
+
+
 @pdt.process_timer
 def run_adapt_schema():
 	"""Run the PrepExternalSchema module to adapt a typing schema."""
 
-	def msg(name=None):
-
-		# Simple command to adapt external schema with default argument values
-		simple_cmd = ('  chewBBACA.py PrepExternalSchema -g <schema_directory> '
-					  '-o <output_directory> '
-					  '--ptf <ptf_path> ')
-
-		# Command to adapt external schema with non-default argument values
-		params_cmd = ('  chewBBACA.py PrepExternalSchema -g <schema_directory> '
-					  '-o <output_directory> '
-					  '--ptf <ptf_path>\n'
-					  '\t\t\t\t  --cpu <cpu_cores> '
-					  '--bsr <blast_score_ratio> '
-					  '--l <minimum_length>\n'
-					  '\t\t\t\t  --t <translation_table> '
-					  '--st <size_threshold>')
-
-		usage_msg = ('\nAdapt external schema (one FASTA file per schema gene):\n\n{0}\n'
-					 '\nAdapt external schema with non-default parameters:\n\n{1}\n'.format(simple_cmd, params_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='PrepExternalSchema',
 									 description='Enables the adaptation of external '
 												 'schemas so that the loci and alleles '
@@ -955,10 +932,8 @@ def run_adapt_schema():
 												 'each gene/locus will be chosen as '
 												 'representatives and included in the '
 												 '"short" directory.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('PrepExternalSchema', nargs='+', help='')
+									 usage=PREP_EXTERNAL_SCHEMA_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-g', '--schema-directory', type=str,
 						required=True, dest='schema_directory',
@@ -1034,8 +1009,7 @@ def run_adapt_schema():
 							 ' values to filter out alleles during schema '
 							 'adaptation.')
 
-	args = parser.parse_args()
-	del args.PrepExternalSchema
+	args = parser.parse_args(sys.argv[2:])
 
 	# Check if PTF exists
 	if args.ptf_path is not None:
@@ -1082,6 +1056,7 @@ def run_adapt_schema():
 		  f'adaptation and {args.size_threshold} to store in the schema '
 		  'config file.')
 
+	adapt_schema = load_module(SUBCOMMAND_MODULES['adapt_schema'])
 	adapt_schema.main(loci_list, output_dirs,
 					  args.cpu_cores, args.blast_score_ratio,
 					  adaptation_ml, args.translation_table,
@@ -1090,9 +1065,8 @@ def run_adapt_schema():
 	# Copy training file to schema directory
 	ptf_hash = None
 	if args.ptf_path is not None:
-		shutil.copy(args.ptf_path, schema_path)
-		# Determine PTF checksum
-		ptf_hash = fo.hash_file(args.ptf_path, hashlib.blake2b())
+		# Copy PTF and determine its checksum in a single pass
+		ptf_hash = fo.hash_and_copy_file(args.ptf_path, schema_path, hashlib.blake2b())
 		print('Copied Prodigal training file to schema directory.')
 
 	# Write schema config file
@@ -1111,48 +1085,28 @@ def run_adapt_schema():
 	os.remove(loci_list)
 
 
+UNIPROT_FINDER_USAGE = ('\nFind annotations for loci in a schema:\n'
+						'\n  chewBBACA.py UniprotFinder -g <schema_directory> -o <output_directory> -t <protein_table>\n'
+						'\t\t\t     --taxa "Streptococcus agalactiae" --cpu <cpu_cores>\n'
+						'\nAlign against reference proteomes of several species:\n'
+						'\n  chewBBACA.py UniprotFinder -g <schema_directory> -t <protein_table> -o <output_directory>\n'
+						'\t\t\t     --taxa "Streptococcus agalactiae" "Streptococcus pyogenes" --cpu <cpu_cores>\n'
+						'\nAlign against reference proteomes of a genus:\n'
+						'\n  chewBBACA.py UniprotFinder -g <schema_directory> -t <protein_table> -o <output_directory>\n'
+						'\t\t\t     --taxa "Streptococcus" --cpu <cpu_cores>\n')
+
+
 @pdt.process_timer
 def run_annotate_schema():
 	"""Run the UniprotFinder module to annotate loci in a schema."""
 
-	def msg(name=None):
-
-		# Simple command to find annotations by querying Uniprot's SPARQL endpoint
-		# and aligning against reference proteomes
-		simple_cmd = ('  chewBBACA.py UniprotFinder -g <schema_directory> '
-					  '-o <output_directory> -t <protein_table>\n'
-					  '\t\t\t     --taxa "Streptococcus agalactiae" '
-					  '--cpu <cpu_cores>')
-
-		# Command to align against the reference proteomes of several species
-		multiple_cmd = ('  chewBBACA.py UniprotFinder -g <schema_directory> '
-						'-t <protein_table> -o <output_directory>\n'
-						'\t\t\t     --taxa "Streptococcus agalactiae" "Streptococcus pyogenes" '
-						'--cpu <cpu_cores>')
-
-		# Command to align against the reference proteomes at genus level
-		genus_cmd = ('  chewBBACA.py UniprotFinder -g <schema_directory> '
-					  '-t <protein_table> -o <output_directory>\n'
-					  '\t\t\t     --taxa "Streptococcus" '
-					  '--cpu <cpu_cores>')
-
-		usage_msg = ('\nFind annotations for loci in a schema:\n\n{0}\n'
-					 '\nAlign against reference proteomes of several species:\n\n{1}\n'
-					 '\nAlign against reference proteomes of a genus:\n\n{2}\n'.format(simple_cmd,
-																					   multiple_cmd,
-																					   genus_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='UniprotFinder',
 									 description='Determines loci annotations based '
 												 'on exact matches found in UniProt\'s '
 												 'database and based on alignment against '
 												 'reference proteomes for a set of taxa.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('UniprotFinder', nargs='+', help='')
+									 usage=UNIPROT_FINDER_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-g', '--schema-directory', type=str,
 						required=True, dest='schema_directory',
@@ -1225,41 +1179,28 @@ def run_annotate_schema():
 						help='Path to the directory that contains the '
 							 'BLAST executables.')
 
-	args = parser.parse_args()
-	del args.UniprotFinder
+	args = parser.parse_args(sys.argv[2:])
 
+	annotate_schema = load_module(SUBCOMMAND_MODULES['annotate_schema'])
 	annotate_schema.main(**vars(args))
 
 
+DOWNLOAD_SCHEMA_USAGE = ('\nDownload schema:\n'
+						 '  chewBBACA.py DownloadSchema -sp <species_id> -sc <schema_id> -o <download_folder> \n'
+						 '\nDownload schema with non-default parameters:\n'
+						 '  chewBBACA.py DownloadSchema -sp <species_id> -sc <schema_id> -o <download_folder>\n'
+						 '\t\t\t      --cpu <cpu_cores> --ns <nomenclature_server_url> \n')
+
+
 @pdt.process_timer
 def run_download_schema():
 	"""Run the DownloadSchema module to download a schema from Chewie-NS."""
 
-	def msg(name=None):
-		# simple command to download a schema from the NS
-		simple_cmd = ('  chewBBACA.py DownloadSchema -sp <species_id> '
-					  '-sc <schema_id> '
-					  '-o <download_folder> ')
-
-		# command to download a schema from the NS with non-default arguments values
-		params_cmd = ('  chewBBACA.py DownloadSchema -sp <species_id> '
-					  '-sc <schema_id> '
-					  '-o <download_folder>\n'
-					  '\t\t\t      --cpu <cpu_cores> '
-					  '--ns <nomenclature_server_url> ')
-
-		usage_msg = ('\nDownload schema:\n{0}\n'
-					 '\nDownload schema with non-default parameters:\n{1}\n'.format(simple_cmd, params_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='DownloadSchema',
 									 description='This program downloads '
 												 'a schema from chewie-NS.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('DownloadSchema', nargs='+', help='')
+									 usage=DOWNLOAD_SCHEMA_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-sp', '--species-id', type=str,
 						required=True, dest='species_id',
@@ -1312,49 +1253,32 @@ def run_download_schema():
 							 'not the latest, downloads all loci FASTA files '
 							 'and constructs schema locally.')
 
-	args = parser.parse_args()
-	del args.DownloadSchema
+	args = parser.parse_args(sys.argv[2:])
 
+	download_schema = load_module(SUBCOMMAND_MODULES['download_schema'])
 	download_schema.main(**vars(args))
 
 
+LOAD_SCHEMA_USAGE = ('\nLoad schema:\n'
+					 '  chewBBACA.py LoadSchema -i <schema_directory> -sp <species_id> -sn <schema_name>\n'
+					 '\t\t\t  -lp <loci_prefix> \n'
+					 '\nLoad schema with non-default parameters:\n'
+					 '  chewBBACA.py LoadSchema -i <schema_directory> -sp <species_id> -sn <schema_name>\n'
+					 '\t\t\t  -lp <loci_prefix> --ns <nomenclature_server_url>\n'
+					 '\nContinue schema upload that was interrupted or aborted:\n'
+					 '  chewBBACA.py LoadSchema -i <schema_directory> -sp <species_id> -sn <schema_name>\n'
+					 '\t\t\t  --continue_up\n')
+
+
 @pdt.process_timer
 def run_upload_schema():
 	"""Run the LoadSchema module to upload a schema to Chewie-NS."""
 
-	def msg(name=None):
-		# simple command to load a schema to the NS
-		simple_cmd = ('  chewBBACA.py LoadSchema -i <schema_directory> '
-					  '-sp <species_id> '
-					  '-sn <schema_name>\n'
-					  '\t\t\t  -lp <loci_prefix> ')
-
-		# command to load a schema to the NS with non-default arguments values
-		params_cmd = ('  chewBBACA.py LoadSchema -i <schema_directory> '
-					  '-sp <species_id> '
-					  '-sn <schema_name>\n'
-					  '\t\t\t  -lp <loci_prefix> '
-					  '--ns <nomenclature_server_url>')
-
-		# command to continue schema upload that was interrupted or aborted
-		continue_cmd = ('  chewBBACA.py LoadSchema -i <schema_directory> '
-						'-sp <species_id> '
-						'-sn <schema_name>\n'
-						'\t\t\t  --continue_up')
-
-		usage_msg = ('\nLoad schema:\n{0}\n'
-					 '\nLoad schema with non-default parameters:\n{1}\n'
-					 '\nContinue schema upload that was interrupted or aborted:\n{2}\n'.format(simple_cmd, params_cmd, continue_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='LoadSchema',
 									 description='This program uploads '
 												 'a schema to the NS.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('LoadSchema', nargs='+', help='')
+									 usage=LOAD_SCHEMA_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-i', '--schema-directory', type=str,
 						required=True, dest='schema_directory',
@@ -1420,43 +1344,30 @@ def run_upload_schema():
 						help='Check if the schema upload was interrupted and '
 							 'attempt to continue upload.')
 
-	args = parser.parse_args()
-	del args.LoadSchema
+	args = parser.parse_args(sys.argv[2:])
 
+	upload_schema = load_module(SUBCOMMAND_MODULES['upload_schema'])
 	upload_schema.main(**vars(args))
 
 
+SYNC_SCHEMA_USAGE = ('\nSync schema:\n'
+					 '  chewBBACA.py SyncSchema -sc <schema_directory> \n'
+					 '\nSync schema with non-default parameters:\n'
+					 '  chewBBACA.py SyncSchema -sc <schema_directory> --cpu <cpu_cores> --ns <nomenclature_server_url>\n'
+					 '\nSync schema and send novel local alleles to the NS:\n'
+					 '  chewBBACA.py SyncSchema -sc <schema_directory> --submit\n')
+
+
 @pdt.process_timer
 def run_synchronize_schema():
 	"""Run the SyncSchema module to synchronize a local schema with the remote version in Chewie-NS."""
 
-	def msg(name=None):
-		# simple command to synchronize a schema with its NS version
-		simple_cmd = ('  chewBBACA.py SyncSchema -sc <schema_directory> ')
-
-		# command to synchronize a schema with its NS version with non-default arguments values
-		params_cmd = ('  chewBBACA.py SyncSchema -sc <schema_directory> '
-					  '--cpu <cpu_cores> '
-					  '--ns <nomenclature_server_url>')
-
-		# command to submit novel local alleles
-		submit_cmd = (
-			'  chewBBACA.py SyncSchema -sc <schema_directory> --submit')
-
-		usage_msg = ('\nSync schema:\n{0}\n'
-					 '\nSync schema with non-default parameters:\n{1}\n'
-					 '\nSync schema and send novel local alleles to the NS:\n{2}\n'.format(simple_cmd, params_cmd, submit_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='SyncSchema',
 									 description='Synchronize a local schema, previously '
 												 'downloaded from Chewie-NS, with its latest '
 												 'version in Chewie-NS.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('SyncSchema', nargs='+', help='')
+									 usage=SYNC_SCHEMA_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-sc', '--schema-directory', type=str,
 						required=True, dest='schema_directory',
@@ -1505,42 +1416,30 @@ def run_synchronize_schema():
 	#                     help='If the process should update local profiles '
 	#                          'stored in the SQLite database.')
 
-	args = parser.parse_args()
-	del args.SyncSchema
+	args = parser.parse_args(sys.argv[2:])
 
+	synchronize_schema = load_module(SUBCOMMAND_MODULES['synchronize_schema'])
 	synchronize_schema.main(**vars(args))
 
 
+NS_STATS_USAGE = ('\nList species and totals:\n'
+				  '  chewBBACA.py NSStats -m species \n'
+				  '\nList all schemas for a species and associated information:\n'
+				  '  chewBBACA.py NSStats -m schemas --sp <species_id> \n'
+				  '\nGet information about a particular schema:\n'
+				  '  chewBBACA.py NSStats -m schemas --sp <species_id> --sc <schema_id>\n')
+
+
 @pdt.process_timer
 def run_stats_requests():
 	"""Run the NSStats module to get information about schemas in Chewie-NS."""
 
-	def msg(name=None):
-		# simple command to list species and totals
-		simple_cmd = ('  chewBBACA.py NSStats -m species ')
-
-		# command to list all schemas for a species
-		schemas_cmd = ('  chewBBACA.py NSStats -m schemas --sp <species_id> ')
-
-		# command to get information about a single schema
-		schema_cmd = ('  chewBBACA.py NSStats -m schemas --sp <species_id> '
-					  '--sc <schema_id>')
-
-		usage_msg = ('\nList species and totals:\n{0}\n'
-					 '\nList all schemas for a species and associated information:\n{1}\n'
-					 '\nGet information about a particular schema:\n{2}\n'
-					 ''.format(simple_cmd, schemas_cmd, schema_cmd))
-
-		return usage_msg
-
 	parser = argparse.ArgumentParser(prog='NSStats',
 									 description='Retrieve basic information '
 												 'about the species and schemas in '
 												 'a Chewie-NS instance.',
-									 usage=msg(),
-									 formatter_class=ModifiedHelpFormatter)
-
-	parser.add_argument('NSStats', nargs='+', help='')
+									 usage=NS_STATS_USAGE,
+									 formatter_class=pv.ModifiedHelpFormatter)
 
 	parser.add_argument('-m', '--mode', type=str,
 						required=True, dest='mode',
@@ -1570,87 +1469,112 @@ def run_stats_requests():
 							 'Users may also provide the IP address to other '
 							 'Chewie-NS instances.')
 
-	args = parser.parse_args()
-	del args.NSStats
+	args = parser.parse_args(sys.argv[2:])
 
+	stats_requests = load_module(SUBCOMMAND_MODULES['stats_requests'])
 	stats_requests.main(**vars(args))
 
 
+# Name, description and function that runs each module
+ModuleInfo = namedtuple('ModuleInfo', ['name', 'description', 'function'])
+MODULES = (
+	ModuleInfo('CreateSchema',
+	           'Create a gene-by-gene schema based on '
+	           'a set of genome assemblies or coding sequences.',
+	           run_create_schema),
+	ModuleInfo('AlleleCall',
+	           'Determine the allelic profiles of a set of '
+	           'bacterial genomes based on a schema.',
+	           run_allele_call),
+	ModuleInfo('SchemaEvaluator',
+	           'Build an interactive report for schema evaluation.',
+	           run_evaluate_schema),
+	ModuleInfo('AlleleCallEvaluator',
+	           'Build an interactive report for allele calling results evaluation.',
+	           run_evaluate_calls),
+	ModuleInfo('ExtractCgMLST',
+	           'Determines the set of '
+	           'loci that constitute the '
+	           'core genome based on loci '
+	           'presence thresholds.',
+	           run_determine_cgmlst),
+	ModuleInfo('RemoveGenes',
+	           'Remove a list of loci from '
+	           'your allele call output.',
+	           run_remove_genes),
+	ModuleInfo('PrepExternalSchema',
+	           'Adapt an external schema to be '
+	           'used with chewBBACA.',
+	           run_adapt_schema),
+	ModuleInfo('JoinProfiles',
+	           'Join allele calling results from '
+	           'different runs.',
+	           run_join_profiles),
+	ModuleInfo('UniprotFinder',
+	           'Retrieve annotations for loci in a schema.',
+	           run_annotate_schema),
+	ModuleInfo('DownloadSchema',
+	           'Download a schema from Chewie-NS.',
+	           run_download_schema),
+	ModuleInfo('LoadSchema',
+	           'Upload a schema to Chewie-NS.',
+	           run_upload_schema),
+	ModuleInfo('SyncSchema',
+	           'Synchronize a schema with its remote version '
+	           'in Chewie-NS.',
+	           run_synchronize_schema),
+	ModuleInfo('NSStats',
+	           'Retrieve basic information about the species '
+	           'and schemas in Chewie-NS.',
+	           run_stats_requests),
+)
+
+# Select module data by name
+MODULES_INDEX = {module.name: module for module in MODULES}
+
+# Banner printed before running a module
+BANNER = (f'chewBBACA version: {version}\n'
+		  f'Authors: {ct.authors}\n'
+		  f'Github: {ct.repository}\n'
+		  f'Documentation: {ct.documentation}\n'
+		  f'Contacts: {ct.contacts}\n\n')
+
+# Message listing the available modules
+MODULES_HELP = ('USAGE: chewBBACA.py [module] -h, --help\n\n'
+				'Select one of the following modules:\n'
+				+ ''.join(f'{name}: {description}\n' for name, description, _ in MODULES))
+
+
 def main():
 
-	functions_info = {'CreateSchema': ['Create a gene-by-gene schema based on '
-									   'a set of genome assemblies or coding sequences.',
-									   run_create_schema],
-					  'AlleleCall': ['Determine the allelic profiles of a set of '
-									 'bacterial genomes based on a schema.',
-									 run_allele_call],
-					  'SchemaEvaluator': ['Build an interactive report for schema evaluation.',
-										  run_evaluate_schema],
-					  'AlleleCallEvaluator': ['Build an interactive report for allele calling results evaluation.',
-											  run_evaluate_calls],
-					  'ExtractCgMLST': ['Determines the set of '
-										'loci that constitute the '
-										'core genome based on loci '
-										'presence thresholds.',
-										run_determine_cgmlst],
-					  'RemoveGenes': ['Remove a list of loci from '
-									  'your allele call output.',
-									  run_remove_genes],
-					  'PrepExternalSchema': ['Adapt an external schema to be '
-											 'used with chewBBACA.',
-											 run_adapt_schema],
-					  'JoinProfiles': ['Join allele calling results from '
-									   'different runs.',
-									   run_join_profiles],
-					  'UniprotFinder': ['Retrieve annotations for loci in a schema.',
-										run_annotate_schema],
-					  'DownloadSchema': ['Download a schema from Chewie-NS.',
-										 run_download_schema],
-					  'LoadSchema': ['Upload a schema to Chewie-NS.',
-									 run_upload_schema],
-					  'SyncSchema': ['Synchronize a schema with its remote version '
-									 'in Chewie-NS.',
-									 run_synchronize_schema],
-					  'NSStats': ['Retrieve basic information about the species '
-								  'and schemas in Chewie-NS.',
-								  run_stats_requests]}
-
-	version_triggers = ['-v', '--v', '-version', '--version']
-	if len(sys.argv) > 1 and sys.argv[1] in version_triggers:
+	process = sys.argv[1] if len(sys.argv) > 1 else None
+	if process in VERSION_TRIGGERS:
 		# Print version and exit
 		print('chewBBACA version: {0}'.format(version))
 		sys.exit(0)
 
-	print('chewBBACA version: {0}'.format(version))
-	print('Authors: {0}'.format(ct.authors))
-	print('Github: {0}'.format(ct.repository))
-	print('Documentation: {0}'.format(ct.documentation))
-	print('Contacts: {0}\n'.format(ct.contacts))
-
 	# Display help message if selected process is not valid
-	help_triggers = ['-h', '--h', '-help', '--help']
-	if len(sys.argv) == 1 or sys.argv[1] not in functions_info or sys.argv[1] in help_triggers:
+	module = MODULES_INDEX.get(process)
+	if module is None:
 		exit_code = 0
 		# Detect if user passed module name that does not exist
-		if len(sys.argv) > 1 and sys.argv[1] not in help_triggers:
-			print(f'No module named {sys.argv[1]}.\n')
+		if process is not None and process not in HELP_TRIGGERS:
+			print(f'No module named {process}.\n')
 			exit_code = 1
-		print('USAGE: chewBBACA.py [module] -h, --help\n')
-		print('Select one of the following modules:')
-		for f in functions_info:
-			print('{0}: {1}'.format(f, functions_info[f][0]))
-		print(sys.argv)
+		sys.stdout.write(MODULES_HELP)
 		sys.exit(exit_code)
 
-	# Check python version
-	python_version = pv.validate_python_version()
+	# Only print the banner when a module runs
+	sys.stdout.write(BANNER)
+
+	# Check python version before running a module
+	pv.validate_python_version()
 
 	# Trigger module help message if no arguments are provided
-	if len(sys.argv) == 2 and sys.argv[1] in functions_info:
+	if len(sys.argv) == 2:
 		sys.argv.append('-h')
 
-	process = sys.argv[1]
-	functions_info[process][1]()
+	module.function()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+# Bash completion for chewBBACA module names.
+# Source this file or copy it to a bash-completion directory
+# (e.g. ~/.local/share/bash-completion/completions/chewBBACA.py).
+# The module list must match MODULES in CHEWBBACA/chewBBACA.py.
+
+_chewbbaca_modules="CreateSchema AlleleCall SchemaEvaluator AlleleCallEvaluator ExtractCgMLST RemoveGenes PrepExternalSchema JoinProfiles UniprotFinder DownloadSchema LoadSchema SyncSchema NSStats"
+
+_chewbbaca() {
+	local cur="${COMP_WORDS[COMP_CWORD]}"
+	if [ "$COMP_CWORD" -eq 1 ]; then
+		COMPREPLY=($(compgen -W "${_chewbbaca_modules} -h --help -v --version" -- "$cur"))
+	else
+		COMPREPLY=($(compgen -f -- "$cur"))
+	fi
+}
+
+complete -o filenames -F _chewbbaca chewBBACA.py
@@ -5,6 +5,8 @@ This script contains tests to verify the commands to select the main modules wor
 """
 
 
+import os
+import re
 import sys
 import shutil
 import pytest
@@ -71,3 +73,13 @@ def test_help_codes(monkeypatch, args_fixture):
 
 			assert e.type == SystemExit
 			assert e.value.code == args_fixture[1]
+
+
+def test_completion_modules():
+	# The bash completion file must list the same modules as the main script
+	completion_file = os.path.join(os.path.dirname(chewBBACA.__file__),
+								   'completion', 'chewBBACA.bash')
+	with open(completion_file, 'r') as infile:
+		modules = re.search(r'_chewbbaca_modules="([^"]+)"', infile.read()).group(1)
+
+	assert modules.split() == [module.name for module in chewBBACA.MODULES]
@@ -15,6 +15,7 @@ from CHEWBBACA import chewBBACA
 from CHEWBBACA.utils import constants as ct
 from CHEWBBACA.tests import test_arguments as ta
 from CHEWBBACA.utils import file_operations as fo
+from CHEWBBACA.utils import parameters_validation as pv
 
 
 # Use the tmp_path fixture to create a tmp directory for each test
@@ -66,7 +67,7 @@ def test_createschema_valid_input(monkeypatch, args_fixture):
 		schemas_configs = [output_files.pop(0), expected_files.pop(0)]
 
 		# Compare lists of loci
-		assert fo.pickle_loader(genes_lists[0]).sort() == fo.pickle_loader(genes_lists[1]).sort()
+		assert pv.read_gene_list(genes_lists[0]).sort() == pv.read_gene_list(genes_lists[1]).sort()
 		# Read config values
 		# Ignore chewBBACA version value
 		configs1 = fo.pickle_loader(schemas_configs[0])
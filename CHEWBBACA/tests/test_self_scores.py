@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This script contains tests to verify that the self-alignment raw scores
+are determined for representatives that were missing after the first
+BLAST run.
+"""
+
+
+import shutil
+import pytest
+
+from CHEWBBACA.utils import file_operations as fo
+
+
+# Protein sequences above the blastp-short length threshold
+PROTEINS = {'rep1': 'MKLVINGKTLKGEITVEVPDGATAEEIVKAAAEKLGLSEEDAKNLVLVRNGEVL',
+			'rep2': 'MSEQNNTEMTFQIQRIYTKDISFEAPNAPHVFQKDWQPEVKLDLDTASSQLADDV',
+			'rep3': 'MAHHHHHHVDDDDKMLRPVETPTREIKKLDGLWAFSLDRENCGIDQRWWESALQ'}
+
+
+@pytest.mark.skipif(shutil.which('blastp') is None,
+					reason='BLAST is not installed')
+def test_missing_self_scores_below_five(monkeypatch, tmp_path):
+	# Import here so that collection does not need the gene prediction
+	# dependencies imported by core_functions
+	from CHEWBBACA.utils import core_functions as cf
+
+	fasta_file = str(tmp_path / 'representatives.fasta')
+	fo.write_lines([f'>{seqid}\n{seq}' for seqid, seq in PROTEINS.items()],
+				   fasta_file)
+
+	with monkeypatch.context() as m:
+		# Discard the results of the first BLAST run so that all
+		# self-scores have to be determined in the second run
+		m.setattr(cf.fo, 'read_tabular', lambda *args, **kwargs: [])
+		self_scores = cf.determine_self_scores(fasta_file, str(tmp_path),
+											   shutil.which('makeblastdb'),
+											   shutil.which('blastp'),
+											   'prot', 1,
+											   shutil.which('blastdb_aliastool'))
+
+	assert set(self_scores) == set(PROTEINS)
+	for seqid, seq in PROTEINS.items():
+		assert self_scores[seqid][0] == (len(seq)*3)+3
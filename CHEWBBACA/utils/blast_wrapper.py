@@ -5,7 +5,8 @@ Purpose
 -------
 
 This module contains functions related with the execution
-of the BLAST software (https://www.ncbi.nlm.nih.gov/books/NBK279690/).
+of the BLAST software (https://www.ncbi.nlm.nih.gov/books/NBK279690/)
+and of the DIAMOND software (https://github.com/bbuchfink/diamond).
 
 Code documentation
 ------------------
@@ -13,6 +14,7 @@ Code documentation
 
 
 import sys
+import tempfile
 import subprocess
 
 try:
@@ -93,9 +95,8 @@ def determine_blast_task(sequences, blast_type='blastp'):
 	"""
 	# get sequence length threshold for BLAST application
 	length_threshold = ct.BLAST_TASK_THRESHOLD[blast_type]
-	sequence_lengths = [len(p) for p in sequences]
-	minimum_length = min(sequence_lengths)
-	if minimum_length < length_threshold:
+	# stop at the first sequence below the threshold
+	if any(len(p) < length_threshold for p in sequences):
 		blast_task = '{0}-short'.format(blast_type)
 	else:
 		blast_task = blast_type
@@ -105,7 +106,7 @@ def determine_blast_task(sequences, blast_type='blastp'):
 
 def run_blast(blast_path, blast_db, fasta_file, blast_output,
 			  max_hsps=1, threads=1, ids_file=None, blast_task=None,
-			  max_targets=None, composition_stats=None):
+			  max_targets=None, composition_stats=None, stream=False):
 	"""Execute BLAST to align sequences against a BLAST database.
 
 	Parameters
@@ -117,9 +118,9 @@ def run_blast(blast_path, blast_db, fasta_file, blast_output,
 	fasta_file : str
 		Path to the FASTA file with sequences to align against
 		the BLAST database.
-	blast_output : str
+	blast_output : str or None
 		Path to the file that will be created to store the
-		results.
+		results. Ignored if `stream` is True.
 	max_hsps : int
 		Maximum number of High Scoring Pairs per pair of aligned
 		sequences.
@@ -138,6 +139,9 @@ def run_blast(blast_path, blast_db, fasta_file, blast_output,
 	composition_stats : int
 		Specify the composition-based statistics method used
 		by BLAST.
+	stream : bool
+		True to read the results from the BLAST stdout instead
+		of writing them to `blast_output`.
 
 	Returns
 	-------
@@ -145,12 +149,17 @@ def run_blast(blast_path, blast_db, fasta_file, blast_output,
 		BLAST stdout.
 	stderr : bytes or str
 		BLAST stderr.
+
+	If `stream` is True, returns a generator that yields the
+	fields of each line in the BLAST output instead.
 	"""
 	# Do not retrieve hits with high probability of occuring by chance
 	blast_args = [blast_path, '-db', blast_db, '-query', fasta_file,
-				  '-out', blast_output, '-outfmt', ct.BLAST_DEFAULT_OUTFMT,
+				  '-outfmt', ct.BLAST_DEFAULT_OUTFMT,
 				  '-max_hsps', str(max_hsps), '-num_threads', str(threads),
 				  '-evalue', '0.001']
+	if stream is False:
+		blast_args.extend(['-out', blast_output])
 
 	# Add file with list of sequence identifiers to align against
 	if ids_file is not None:
@@ -164,6 +173,9 @@ def run_blast(blast_path, blast_db, fasta_file, blast_output,
 	if composition_stats is not None:
 		blast_args.extend(['-comp_based_stats', str(composition_stats)])
 
+	if stream is True:
+		return stream_blast(blast_args, blast_path, fasta_file)
+
 	blast_process = subprocess.Popen(blast_args,
 								  stdout=subprocess.PIPE,
 								  stderr=subprocess.PIPE)
@@ -178,6 +190,52 @@ def run_blast(blast_path, blast_db, fasta_file, blast_output,
 	return [stdout, stderr]
 
 
+def stream_blast(blast_args, blast_path, fasta_file):
+	"""Run BLAST and yield the results as they are written to stdout.
+
+	Parameters
+	----------
+	blast_args : list
+		BLAST command and arguments, without the '-out' argument.
+	blast_path : str
+		Path to the BLAST application executable.
+	fasta_file : str
+		Path to the FASTA file with sequences to align against
+		the BLAST database.
+
+	Yields
+	------
+	fields : list
+		List with the fields of a line in the BLAST output.
+	"""
+	# Write stderr to a file, a full stderr pipe would block BLAST
+	# while stdout is being read
+	with tempfile.TemporaryFile() as stderr_file:
+		blast_process = subprocess.Popen(blast_args,
+										 stdout=subprocess.PIPE,
+										 stderr=stderr_file,
+										 text=True, bufsize=1 << 20)
+		finished = False
+		try:
+			with blast_process.stdout as stdout:
+				for line in stdout:
+					yield line.rstrip('\n').split('\t')
+			finished = True
+		finally:
+			# Stop BLAST if the results were not fully read
+			if finished is False:
+				blast_process.kill()
+			blast_process.wait()
+
+		stderr_file.seek(0)
+		stderr = stderr_file.read().decode('utf-8', errors='replace')
+
+	if blast_process.returncode != 0 or len(stderr) > 0:
+		sys.exit(f'Error while running BLASTp for {fasta_file}\n'
+				 f'{blast_path} exited with code {blast_process.returncode} '
+				 f'and returned the following error:\n{stderr}')
+
+
 def run_blastdb_aliastool(blastdb_aliastool_path, seqid_infile, seqid_outfile):
 	"""Convert list of sequence identifiers into binary format.
 
@@ -213,3 +271,99 @@ def run_blastdb_aliastool(blastdb_aliastool_path, seqid_infile, seqid_outfile):
 				 f'{blastdb_aliastool_path} returned the following error:\n{stderr}')
 
 	return [stdout, stderr]
+
+
+def make_diamond_db(diamond_path, input_fasta, output_path, threads=1):
+	"""Create a DIAMOND database.
+
+	Parameters
+	----------
+	diamond_path : str
+		Path to the DIAMOND executable.
+	input_fasta : str
+		Path to the FASTA file that contains the protein sequences
+		that will be added to the DIAMOND database.
+	output_path : str
+		Path to the database file (DIAMOND adds the '.dmnd' suffix).
+	threads : int
+		Number of threads used to create the database.
+
+	Returns
+	-------
+	stdout : bytes
+		DIAMOND stdout.
+	stderr : bytes or str
+		DIAMOND stderr.
+	"""
+	makedb_cmd = [diamond_path, 'makedb', '--in', input_fasta,
+				  '--db', output_path, '--threads', str(threads),
+				  '--quiet']
+
+	makedb_process = subprocess.Popen(makedb_cmd,
+									  stdout=subprocess.PIPE,
+									  stderr=subprocess.PIPE)
+
+	stdout, stderr = makedb_process.communicate()
+
+	# DIAMOND writes log messages to stderr, check the exit code instead
+	if makedb_process.returncode != 0:
+		sys.exit(f'Could not create DIAMOND database for {input_fasta}\n'
+				 f'{diamond_path} returned the following stderr:\n{stderr}')
+
+	return [stdout, stderr]
+
+
+def run_diamond(diamond_path, diamond_db, fasta_file, output_file,
+				max_hsps=1, threads=1):
+	"""Execute DIAMOND BLASTp to align sequences against a DIAMOND database.
+
+	The output has the same columns as the BLAST output
+	(`ct.BLAST_DEFAULT_OUTFMT`) and includes the alignment of each
+	query against itself, which is used to compute the BSR.
+
+	Parameters
+	----------
+	diamond_path : str
+		Path to the DIAMOND executable.
+	diamond_db : str
+		Path to the DIAMOND database.
+	fasta_file : str
+		Path to the FASTA file with sequences to align against
+		the DIAMOND database.
+	output_file : str
+		Path to the file that will be created to store the
+		results.
+	max_hsps : int
+		Maximum number of High Scoring Pairs per pair of aligned
+		sequences.
+	threads : int
+		Number of threads used to run DIAMOND.
+
+	Returns
+	-------
+	stdout : bytes
+		DIAMOND stdout.
+	stderr : bytes or str
+		DIAMOND stderr.
+	"""
+	# Report all targets (BLAST defaults to 500 targets, DIAMOND to 25)
+	# Sensitive mode to find hits below the 90% identity targeted by
+	# the default and fast modes
+	diamond_args = [diamond_path, 'blastp', '--db', diamond_db,
+					'--query', fasta_file, '--out', output_file,
+					'--outfmt', *ct.BLAST_DEFAULT_OUTFMT.split(),
+					'--max-hsps', str(max_hsps), '--threads', str(threads),
+					'--evalue', '0.001', '--max-target-seqs', '0',
+					'--sensitive', '--quiet']
+
+	diamond_process = subprocess.Popen(diamond_args,
+									   stdout=subprocess.PIPE,
+									   stderr=subprocess.PIPE)
+
+	stdout, stderr = diamond_process.communicate()
+
+	if diamond_process.returncode != 0:
+		sys.exit(f'Error while running DIAMOND for {fasta_file}\n'
+				 f'{diamond_path} returned the following error:\n{stderr}')
+
+	return [stdout, stderr]
@@ -94,9 +94,9 @@ CREATESCHEMA_CLUSTERING_NGROUPS = 40
 
 # Valid FASTA file extensions
 GZIP_EXTENSIONS = ["gz", "gzip"]
-FASTA_EXTENSIONS = ['.fasta', '.fna', '.ffn', '.fa', '.fas', 
+FASTA_EXTENSIONS = ('.fasta', '.fna', '.ffn', '.fa', '.fas',
                     '.fasta.gz', '.fna.gz', '.ffn.gz', '.fa.gz', '.fas.gz',
-                    '.fasta.gzip', '.fna.gzip', '.ffn.gzip', '.fa.gzip', '.fas.gzip']
+                    '.fasta.gzip', '.fna.gzip', '.ffn.gzip', '.fa.gzip', '.fas.gzip')
 
 # Chewie-NS related constants
 HEADERS_GET_ = {'Authorization': None,
@@ -131,6 +131,9 @@ prompt_timeout = 30
 BLAST_MAJOR = 2
 BLAST_MINOR = 9
 
+# Maximum time, in seconds, to wait for 'blastp -version'
+BLAST_VERSION_TIMEOUT = 30
+
 # Paths to BLASTp and makeblastdb executables in Linux and Windows
 BLASTP_ALIAS = 'blastp.exe' if platform.system() == 'Windows' else shutil.which('blastp')
 MAKEBLASTDB_ALIAS = 'makeblastdb.exe' if platform.system() == 'Windows' else shutil.which('makeblastdb')
@@ -149,13 +152,22 @@ IGNORE_RAISED = ['Warning: [blastp] To obtain better run time '
 # Path to MAFFT executable
 MAFFT_ALIAS = shutil.which('mafft')
 
+# Path to DIAMOND executable (optional aligner for the final BLASTp in CreateSchema)
+DIAMOND_ALIAS = 'diamond.exe' if platform.system() == 'Windows' else shutil.which('diamond')
+# Aligners that can be used to perform the final all-vs-all alignment
+ALIGNERS = ['blast', 'diamond']
+
 # Replacements for genome and loci identifiers
 CHAR_REPLACEMENTS = [("|", "_"), ("_", "-"), ("(", ""),
                      (")", ""), ("'", ""), ("\"", ""),
                      (":", "")]
 
+# Pickle protocol used to serialize objects
+# Protocol 5 requires Python >= 3.8, the minimum version (MIN_PYTHON)
+PICKLE_PROTOCOL = 5
+
 # Minimum Python version
-MIN_PYTHON = [(3, 6, 0), '3.6.0']
+MIN_PYTHON = [(3, 8, 0), '3.8.0']
 
 # UniProt SPARQL endpoint
 UNIPROT_SPARQL = 'https://sparql.uniprot.org/sparql'
@@ -194,6 +206,9 @@ NOVEL_BASENAME = 'novel_alleles.fasta'
 CDS_COORDINATES_BASENAME = 'cds_coordinates.tsv'
 INVALID_CDS_BASENAME = 'invalid_cds.txt'
 SCHEMA_CONFIG_BASENAME = '.schema_config'
+# Stores validated AlleleCall arguments to skip validation on repeated runs
+# Created in the user's cache directory, not in the schema's directory
+ARGUMENTS_CACHE_BASENAME = 'arguments_cache.json'
 GENE_LIST_BASENAME = '.genes_list'
 # Header for TSV file with loci stats
 LOCI_STATS_HEADER = ('Locus\tEXC\tINF\tPLOT3\tPLOT5\tLOTSC\tNIPH\t'
@@ -232,6 +247,9 @@ BLAST_DEFAULT_OUTFMT = '6 qseqid qstart qend qlen sseqid slen score'
 # Input file prefix maximum length
 PREFIX_MAXLEN = 30
 
+# Maximum number of invalid input files listed in error messages
+MAX_REPORTED_FILES = 100
+
 # Dictionary template to map variables returned by AlleleCall
 ALLELECALL_DICT = {'classification_files': None,
                    'basename_map': None,
@@ -433,7 +451,7 @@ FASTA_INPUT_EXCEPTION = ('Input file is a FASTA file. Please provide '
 INVALID_EXTENSION_EXCEPTION = ('The following input files do not have a '
                                'valid file extension:\n{0}\nPlease ensure '
                                'that the filenames end with one of the '
-                               f'following extensions: {FASTA_EXTENSIONS}.')
+                               f'following extensions: {list(FASTA_EXTENSIONS)}.')
 
 # Some of the file paths provided do not exist
 MISSING_INPUTS_EXCEPTION = ('Could not find some of the files provided in '
@@ -449,7 +467,7 @@ MISSING_FASTAS_EXCEPTION = ('Could not get input files. Please provide '
                             'a directory with FASTA files or a file with '
                             'the list of full paths to the FASTA files '
                             'and ensure that filenames end with one of '
-                            f'the following extensions: {FASTA_EXTENSIONS}.')
+                            f'the following extensions: {list(FASTA_EXTENSIONS)}.')
 
 # Input path is neither a file nor a directory
 INVALID_INPUT_PATH = ('Input argument is not a valid directory or '
@@ -457,7 +475,7 @@ INVALID_INPUT_PATH = ('Input argument is not a valid directory or '
                       'provide a valid input, either a folder with FASTA '
                       'files or a file with the list of full paths to FASTA '
                       'files (one per line and ending with one of the '
-                      f'following file extensions: {FASTA_EXTENSIONS}).')
+                      f'following file extensions: {list(FASTA_EXTENSIONS)}).')
 
 # Path to schema does not exist
 SCHEMA_PATH_MISSING = ('Path to input schema does not exist. Please provide '
@@ -559,6 +577,9 @@ BLAST_NO_PATH = ('Could not find BLAST executables.')
 BLAST_NO_VERSION = ('Could not determine BLAST version. Please make '
                  	'sure that BLAST>={0}.{1} is installed.')
 BLAST_UPDATE = ('Found BLAST {0}.{1}. Please update BLAST to version >={2}.{3}')
+DIAMOND_NO_PATH = ('Could not find DIAMOND executable. Please make sure '
+                   'that DIAMOND is installed and in PATH or use '
+                   '"--aligner blast".')
 
 MULTIPLE_PTFS = ('Found more than one Prodigal training '
                  'file in the schema directory.\nPlease maintain '
@@ -13,6 +13,7 @@ Code documentation
 
 
 import os
+import itertools
 
 try:
     from utils import (constants as ct,
@@ -110,9 +111,9 @@ def predict_genes(fasta_files, ptf_path, translation_table,
                   for line in pyrodigal_results
                   if isinstance(line[1], int) is True}
 
-    total_cds = sum([line[1]
-                     for line in pyrodigal_results
-                     if isinstance(line[1], int) is True])
+    total_cds = sum(line[1]
+                    for line in pyrodigal_results
+                    if isinstance(line[1], int) is True)
 
     cds_fastas = [line[2] for line in pyrodigal_results if line[2] is not None]
 
@@ -329,19 +330,15 @@ def exclude_duplicates(fasta_files, temp_directory, cpu_cores,
         hash_table_file = fo.join_paths(temp_directory, ['distinct.hashtable'])
         fo.pickle_dumper(hash_table, hash_table_file)
 
-    # Concatenate Fasta files from parallel processes
+    # Get representative sequences from the Fasta files created by the
+    # parallel processes (same order as the representative seqids)
     dedup_outfiles = [files[1] for files in dedup_inputs]
-    merge_fasta = fo.join_paths(temp_directory, ['concat.fasta'])
-    merge_fasta = fo.concatenate_files(dedup_outfiles, merge_fasta)
-
-    # Create index for concatenated Fasta and get representative sequences
-    merge_fasta_index = fao.index_fasta(merge_fasta)
     representative_fasta = fo.join_paths(temp_directory, ['distinct.fasta'])
-    fao.get_sequences_by_id(merge_fasta_index, representative_seqids,
-                            representative_fasta, 50000)
+    fao.stream_sequences_by_id(dedup_outfiles, representative_seqids,
+                               representative_fasta, 50000)
 
     # Remove intermediate files
-    fo.remove_files(dedup_outfiles+dedup_results+[merge_fasta])
+    fo.remove_files(dedup_outfiles+dedup_results)
 
     return [hash_table, representative_seqids,
             representative_fasta, duplicated_count]
@@ -453,12 +450,9 @@ def translate_sequences(sequence_ids, sequences_file, temp_directory,
     fo.remove_files(protein_files)
 
     # Determine sequences that could not be translated
-    untrans_lines = []
-    untrans_seqids = []
-    for res in translation_results:
-        if len(res[0]) > 0:
-            untrans_lines.extend([f'{r[0]}: {r[1]}' for r in res[0]])
-            untrans_seqids.extend([r[0] for r in res[0]])
+    untranslatable = list(itertools.chain.from_iterable(res[0] for res in translation_results))
+    untrans_seqids = [r[0] for r in untranslatable]
+    untrans_lines = [f'{r[0]}: {r[1]}' for r in untranslatable]
 
     return [protein_file, untrans_seqids, untrans_lines]
 
@@ -644,7 +638,7 @@ def cluster_representative_filter(clusters, representative_filter,
 
     # determine number of sequences that still need to be evaluated
     # +1 to include representative
-    clustered_sequences = sum([len(v)+1 for k, v in pruned_clusters.items()]) + len(singletons)
+    clustered_sequences = sum(len(v)+1 for v in pruned_clusters.values()) + len(singletons)
 
     # write list of excluded seqids to file
     excluded_outfile = os.path.join(output_directory, 'excluded.txt')
@@ -933,39 +927,41 @@ def determine_self_scores(fasta_file, output_directory, makeblastdb_path,
 
     # Determine if we got the score for all representatives
     if len(self_scores) < total_seqids:
-        missing = [seqid
-                   for seqid in all_seqids
-                   if seqid not in [line[0] for line in self_results]]
+        missing = [seqid for seqid in all_seqids if seqid not in self_scores]
         # Index FASTA file
         concat_reps_index = fao.index_fasta(fasta_file)
-        # Get all representatives that do not have a self-score
+        # Align all representatives that do not have a self-score in a
+        # single BLAST run instead of running BLAST once per representative
+        records = [fao.fasta_str_record(ct.FASTA_RECORD_TEMPLATE,
+                                        [seqid, str(concat_reps_index[seqid].seq)])
+                   for seqid in missing]
+        missing_file = fo.join_paths(output_directory, ['missing_self_scores.fasta'])
+        fo.write_lines(records, missing_file)
+        # Create file with representative seqids to only compare against them
+        id_file = fo.join_paths(output_directory, ['missing_self_scores_ids.txt'])
+        fo.write_lines(missing, id_file)
+        if blastdb_aliastool_path is not None:
+            binary_file = f'{id_file}.bin'
+            blast_std = bw.run_blastdb_aliastool(blastdb_aliastool_path,
+                                                 id_file,
+                                                 binary_file)
+            id_file = binary_file
+
+        # Cannot get self-alignemnt for some sequences if composition-based stats is enabled
+        # Report all targets to avoid excluding the self-alignment
+        # BLAST warns in stderr if it examines fewer than 5 targets
+        missing_results = bw.run_blast(blast_path, blast_db, missing_file,
+                                       None, 1, 1, id_file, 'blastp',
+                                       max(len(missing), 5), 0, stream=True)
+        for line in missing_results:
+            if line[0] == line[4]:
+                dna_length = (int(line[3])*3)+3
+                self_scores[line[0]] = (dna_length, float(line[6]))
+
         for seqid in missing:
-            current_rep = concat_reps_index[seqid]
-            record = fao.fasta_str_record(ct.FASTA_RECORD_TEMPLATE, [current_rep.id, str(current_rep.seq)])
-            rep_file = fo.join_paths(output_directory, [f'{current_rep.id}_solo.fasta'])
-            fo.write_lines([record], rep_file)
-            # Create file with representative seqid to only compare against self
-            id_file = fo.join_paths(output_directory, [f'{current_rep.id}_ids.txt'])
-            fo.write_lines([current_rep.id], id_file)
-            if blastdb_aliastool_path is not None:
-                binary_file = f'{id_file}.bin'
-                blast_std = bw.run_blastdb_aliastool(blastdb_aliastool_path,
-                            			             id_file,
-                                        			 binary_file)
-                id_file = binary_file
-
-            rep_blastout = fo.join_paths(output_directory, [f'{current_rep.id}_blastout.tsv'])
-            # Cannot get self-alignemnt for some sequences if composition-based stats is enabled
-            blast_std = bw.run_blast(blast_path, blast_db, rep_file,
-                                     rep_blastout, 1, 1,
-                                     id_file, 'blastp', None, 0)
-            rep_results = fo.read_tabular(rep_blastout)
-            if len(rep_results) > 0:
-                dna_length = (int(rep_results[0][3])*3)+3
-                self_scores[rep_results[0][0]] = (dna_length, float(rep_results[0][6]))
-            else:
+            if seqid not in self_scores:
                 print('Could not determine the self-alignment raw '
-                      f'score for {rep_results[0][0]}')
+                      f'score for {seqid}')
 
     return self_scores
 
@@ -16,10 +16,9 @@ Code documentation
 
 
 import os
-import csv
 import math
-
 import random
+from multiprocessing import shared_memory
 
 import numpy as np
 import pandas as pd
@@ -27,22 +26,24 @@ import pandas as pd
 try:
     from utils import (
         constants as ct,
-        file_operations as fo,
         iterables_manipulation as im,
         multiprocessing_operations as mo)
 except ModuleNotFoundError:
     from CHEWBBACA.utils import (
         constants as ct,
-        file_operations as fo,
         iterables_manipulation as im,
         multiprocessing_operations as mo)
 
 
+# arrays used by all tasks that run in a worker process
+worker_arrays = {}
+
+
 def tsv_to_nparray(input_file, array_dtype='int32'):
     """Read matrix of allelic profiles and convert to Numpy array.
 
-    File lines are read as a generator to exclude the sample identifier
-    and avoid loading huge files into memory.
+    Uses the C parser from pandas and excludes the column with
+    the sample identifiers.
 
     Parameters
     ----------
@@ -58,29 +59,52 @@ def tsv_to_nparray(input_file, array_dtype='int32'):
         Numpy array with the numeric values for
         all allelic profiles.
     """
-    # import matrix without column and row identifiers
+    # determine number of columns from the header
     with open(input_file, 'r') as infile:
-        lines = ('\t'.join(line.split('\t')[1:])
-                 for line in infile)
-        # dtype=float32 should be faster than integer dtypes
-        # but runs faster with dtype=int32 in test setup
-        # dtype=int32 supports max integer of 2,147,483,647
-        # should be safe even when arrays are multiplied
-        np_array = np.genfromtxt(fname=lines, delimiter='\t',
-                                 dtype=array_dtype, skip_header=1)
-
-        # need to reshape array to 2D if it only has info for one sample
-        try:
-            # if it does not have columns it needs to be reshaped
-            np_array.shape[1]
-        except Exception:
-            np_array = np.array([np_array])
+        total_columns = infile.readline().count('\t') + 1
+
+    # import matrix without column and row identifiers
+    # dtype=float32 should be faster than integer dtypes
+    # but runs faster with dtype=int32 in test setup
+    # dtype=int32 supports max integer of 2,147,483,647
+    # should be safe even when arrays are multiplied
+    matrix_df = pd.read_csv(input_file, sep='\t', header=0,
+                            usecols=range(1, total_columns),
+                            dtype=array_dtype, engine='c',
+                            memory_map=True)
+    np_array = np.ascontiguousarray(matrix_df.to_numpy())
 
     return np_array
 
 
-def compute_distances(indexes, np_matrix, genome_ids, tmp_directory):
-    """Compute pairwise allelic differences and number of shared loci.
+def row_offset(row_index, total_rows):
+    """Determine the position of a row's first distance in a condensed matrix.
+
+    The condensed matrix stores the values above the diagonal of a
+    square matrix row by row, the same layout used by
+    scipy.spatial.distance.pdist.
+
+    Parameters
+    ----------
+    row_index : int or ndarray
+        Index of the row in the square matrix.
+    total_rows : int
+        Total number of rows in the square matrix.
+
+    Returns
+    -------
+    offset : int or ndarray
+        Index of the distance between the row and the next
+        row in the condensed matrix.
+    """
+    offset = row_index*(2*total_rows-row_index-1)//2
+
+    return offset
+
+
+def compute_distances(indexes, np_matrix, distances, present=None,
+                      different_buffer=None):
+    """Compute pairwise allelic differences.
 
     Parameters
     ----------
@@ -89,48 +113,101 @@ def compute_distances(indexes, np_matrix, genome_ids, tmp_directory):
         that will be processed.
     np_matrix : ndarray
         Numpy array with dtype=int32 values for allelic profiles.
-    genome_ids : list
-        List with sample identifiers.
-    tmp_directory : str
-        Path to temporary directory where pickle files with
-        results will be stored.
+    distances : ndarray
+        Condensed distance matrix to which the pairwise
+        allelic differences will be written.
+    present : ndarray or NoneType
+        Boolean array with the loci that have an allele
+        identifier in each profile. Determined from `np_matrix`
+        if not provided.
+    different_buffer : ndarray or NoneType
+        Boolean array with the same shape as `np_matrix`
+        used to store intermediate results. Allocated if
+        not provided.
 
     Returns
     -------
-    output_files : list
-        List with the paths to all pickle files that were created
-        to store results.
+    None.
     """
-    # multiply one row per cycle to avoid memory overflow
-    # read only part of the matrix for huge files and process in chunks?
-    output_files = {}
+    total_rows = len(np_matrix)
+    # loci with an allele identifier, determined once for all rows
+    # boolean arrays use a quarter of the memory of int32 arrays
+    if present is None:
+        present = np_matrix != 0
+    # buffer reused in every cycle to avoid allocating a new array per row
+    if different_buffer is None:
+        different_buffer = np.empty(np_matrix.shape, dtype=bool)
+    # compare one row per cycle to avoid memory overflow
     for i in indexes:
-        current_genome = genome_ids[i]
         # get one row to perform pairwise comparisons against whole matrix
-        current_row = np_matrix[i:i+1, :]
-        # do not multiply against rows that were multiplied against
+        current_row = np_matrix[i, :]
+        # do not compare against rows that were compared against
         # matrix's rows in previous iterations
         # combinations instead of permutations
-        permutation_rows = np_matrix[i:, :]
+        permutation_rows = np_matrix[i+1:, :]
+
+        # loci with different alleles, only kept for loci that
+        # have an allele identifier in both samples (shared loci)
+        different = different_buffer[:len(permutation_rows), :]
+        np.not_equal(permutation_rows, current_row, out=different)
+        different &= present[i+1:, :]
+        different &= present[i, :]
+
+        offset = row_offset(i, total_rows)
+        distances[offset:offset+len(permutation_rows)] = np.count_nonzero(different, axis=-1)
 
-        # multiply 1D-array per whole matrix
-        # all non-shared loci will be converted to 0
-        # values different than 0 correspond to shared loci
-        multiplied = current_row * permutation_rows
-        # count number of shared loci, non-zero values
-        # pairwise_shared_loci = np.count_nonzero(multiplied, axis=-1)
 
-        # subtraction will lead to values different than 0 for loci that have different alleles
-        # multiplying ensures that we only keep results for shared loci and not for
-        # loci that are not shared and that had value different than 0 from subtraction
-        pairwise_allelic_differences = np.count_nonzero(multiplied * (current_row - permutation_rows), axis=-1)
+def attach_shared_arrays(matrix_shm_name, matrix_shape, matrix_dtype,
+                         distances_file):
+    """Attach a worker process to the arrays shared by all workers.
 
-        output_file = os.path.join(tmp_directory, current_genome)
-        # fo.pickle_dumper([pairwise_shared_loci, pairwise_allelic_differences], output_file)
-        fo.pickle_dumper([pairwise_allelic_differences], output_file)
-        output_files[current_genome] = output_file
+    Called once when each worker process starts so that tasks do
+    not have to receive the matrix or recompute its masks.
 
-    return output_files
+    Parameters
+    ----------
+    matrix_shm_name : str
+        Name of the shared memory block that contains the
+        matrix with allelic profiles.
+    matrix_shape : tuple
+        Shape of the matrix with allelic profiles.
+    matrix_dtype : str
+        Data type of the matrix with allelic profiles.
+    distances_file : str
+        Path to the NPY file with the condensed distance
+        matrix.
+
+    Returns
+    -------
+    None.
+    """
+    matrix_shm = shared_memory.SharedMemory(name=matrix_shm_name)
+    np_matrix = np.ndarray(matrix_shape, dtype=matrix_dtype, buffer=matrix_shm.buf)
+    # keep a reference to the block so that it is not closed
+    worker_arrays['matrix_shm'] = matrix_shm
+    worker_arrays['np_matrix'] = np_matrix
+    worker_arrays['present'] = np_matrix != 0
+    worker_arrays['different_buffer'] = np.empty(matrix_shape, dtype=bool)
+    # each process writes to a different section of the memory-mapped file
+    worker_arrays['distances'] = np.lib.format.open_memmap(distances_file, mode='r+')
+
+
+def shared_compute_distances(indexes):
+    """Compute pairwise distances with the arrays attached to the worker.
+
+    Parameters
+    ----------
+    indexes : list
+        List with the line index of the allelic profiles
+        that will be processed.
+
+    Returns
+    -------
+    None.
+    """
+    compute_distances(indexes, worker_arrays['np_matrix'],
+                      worker_arrays['distances'], worker_arrays['present'],
+                      worker_arrays['different_buffer'])
 
 
 def get_sample_ids(input_file, delimiter='\t'):
@@ -149,24 +226,27 @@ def get_sample_ids(input_file, delimiter='\t'):
     sample_ids : list
         List with the sample identifiers.
     """
+    # profiles are not quoted, only split the first field of each line
     with open(input_file, 'r') as infile:
-        reader = csv.reader(infile, delimiter=delimiter)
-        sample_ids = [line[0] for line in reader][1:]
+        # skip header
+        infile.readline()
+        sample_ids = [line.split(delimiter, 1)[0].rstrip('\r\n')
+                      for line in infile]
 
     return sample_ids
 
 
-# def write_matrices(pickled_results, genome_ids, output_pairwise,
-#                    output_p, col_ids):
-def write_matrices(pickled_results, genome_ids, output_pairwise, col_ids):
-    """Write above diagonal matrices with allelic differences and shared loci.
+# def write_matrices(distances, genome_ids, output_pairwise,
+#                    output_p, col_ids, symmetric=False, inverse=None):
+def write_matrices(distances, genome_ids, output_pairwise, col_ids,
+                   symmetric=False, inverse=None):
+    """Write matrices with allelic differences and shared loci.
 
     Parameters
     ----------
-    pickled_results : dict
-        Dictionary with sample identifiers as keys
-        and paths to binary files with pickled results
-        as values.
+    distances : ndarray
+        Condensed distance matrix with the pairwise
+        allelic differences.
     genome_ids : list
         List with sample identifiers.
     output_pairwise : str
@@ -177,163 +257,69 @@ def write_matrices(pickled_results, genome_ids, output_pairwise, col_ids):
         with pairwise shared loci will be saved.
     col_ids: list
         List with sample identifiers to add as headers.
+    symmetric : bool
+        True to write a symmetric matrix, False to only
+        write the values above the diagonal.
+    inverse : ndarray or NoneType
+        Index of the unique profile of each sample if the
+        distances were only computed for unique profiles,
+        None otherwise.
 
     Returns
     -------
     None.
     """
-    # sl_lines = [col_ids]
-    ad_lines = [col_ids]
+    # sl_lines = [im.join_list(col_ids, '\t')]
+    ad_lines = [im.join_list(col_ids, '\t')]
     limit = 300
-    for g in genome_ids:
-        current_file = pickled_results[g]
-        # load data
-        data = fo.pickle_loader(current_file)
-
-        # shared_loci = list(data[0])
-        # shared_loci = list(map(str, shared_loci))
-        allele_diffs = list(data[0])
-        allele_diffs = list(map(str, allele_diffs))
-
-        padding = [''] * (len(genome_ids)-len(allele_diffs))
-
-        # sl_line = [g] + padding + shared_loci
-        # sl_lines.append(sl_line)
-        ad_line = [g] + padding + allele_diffs
-        ad_lines.append(ad_line)
-
-        # if len(sl_lines) >= limit or g == genome_ids[-1]:
-        if len(ad_lines) >= limit or g == genome_ids[-1]:
-            ad_lines = [im.join_list(line, '\t') for line in ad_lines]
-            fo.write_lines(ad_lines, output_pairwise, joiner='\n', write_mode='a')
-            ad_lines = []
-            # write_lines(sl_lines, output_p, mode='a')
-            # sl_lines = []
+    total_rows = len(genome_ids)
+    total_unique = total_rows if inverse is None else int(inverse.max()) + 1
+    # position of the distance between row j and row u, for j < u,
+    # is lower_offsets[j] + u in the condensed matrix
+    unique_indexes = np.arange(total_unique)
+    lower_offsets = row_offset(unique_indexes, total_unique) - unique_indexes - 1
+    # formatting all values of a row with a single '%' operation is
+    # faster than converting each value with str and joining
+    values_format = '\t%d' * total_rows
+    # keep the file open and write sets of lines instead of reopening
+    # the file to append each set
+    with open(output_pairwise, 'w') as outfile:
+        for i, g in enumerate(genome_ids):
+            if inverse is None:
+                offset = row_offset(i, total_rows)
+                # distance to itself is not stored in the condensed matrix
+                allele_diffs = [0] + distances[offset:offset+total_rows-i-1].tolist()
+                if symmetric is True:
+                    # get values below the diagonal from the rows above
+                    allele_diffs = distances[lower_offsets[:i] + i].tolist() + allele_diffs
+            else:
+                # samples with identical profiles share the same row
+                u = inverse[i]
+                offset = row_offset(u, total_unique)
+                unique_diffs = np.concatenate((distances[lower_offsets[:u] + u], [0],
+                                               distances[offset:offset+total_unique-u-1]))
+                if symmetric is True:
+                    allele_diffs = unique_diffs[inverse].tolist()
+                else:
+                    allele_diffs = unique_diffs[inverse[i:]].tolist()
+
+            # sl_line = ...
+            # sl_lines.append(sl_line)
+            # empty fields below the diagonal if the matrix is not symmetric
+            padding = '' if symmetric is True else '\t'*i
+            ad_line = g + padding + values_format[:3*len(allele_diffs)] % tuple(allele_diffs)
+            ad_lines.append(ad_line)
+
+            # if len(sl_lines) >= limit or g == genome_ids[-1]:
+            if len(ad_lines) >= limit or i == total_rows-1:
+                outfile.write(im.join_list(ad_lines, '\n') + '\n')
+                ad_lines = []
+                # write_lines(sl_lines, output_p, mode='a')
+                # sl_lines = []
 
     return True
 
 
-def transpose_matrix(input_file, output_directory):
-    """Transpose lines in a TSV file.
-
-    Parameters
-    ----------
-    input_file : str
-        Path to the input TSV file.
-    output_directory : str
-        Path to the directory to which intermediate files
-        with transposed lines will be written.
-
-    Returns
-    -------
-    output_transpose : str
-        Path to the file with the transposed matrix.
-        This file is created by concatenating all
-        files saved into `output_directory`.
-    """
-    file_id = 1
-    transpose_files = []
-    input_basename = os.path.basename(input_file)
-    with open(input_file, 'r') as infile:
-        # get columns names
-        columns = [e.strip() for e in (infile.__next__()).split('\t')]
-        # divide into smaller sets to avoid loading huge files
-        num_col_sets = math.ceil(len(columns)/500)
-        col_sets = im.divide_list_into_n_chunks(columns, num_col_sets)
-        # use Pandas to read columns sets and save transpose
-        for c in col_sets:
-            # dtype=str or Pandas converts values into floats
-            df = pd.read_csv(input_file, usecols=c, delimiter='\t', dtype=str)
-            output_basename = input_basename.replace('.tsv', '_{0}.tsv'.format(file_id))
-            output_file = os.path.join(output_directory, output_basename)
-            # transpose columns
-            df = df.T
-            # do not save header that contains row indexes
-            df.to_csv(output_file, sep='\t', header=False)
-            transpose_files.append(output_file)
-            file_id += 1
-
-    # concatenate all files with transposed lines
-    output_transpose = input_file.replace('.tsv', '_transpose.tsv')
-    fo.concatenate_files(transpose_files, output_transpose)
-
-    return output_transpose
-
-
-def merge_triangular_matrices(upper_matrix, lower_matrix, output_file, matrix_size):
-    """Merge two triangular matrices to create a symmetric matrix.
-
-    Parameters
-    ----------
-    upper_matrix : str
-        Path to the TSV file that contains the upper
-        triangular matrix.
-    lower_matrix : str
-        Path to the TSV file that contains the lower
-        triangular matrix.
-    output_file : str
-        Path to the output file to which the symmetric
-        matrix will be saved.
-    matrix_size : int
-        Total number of lines in the triangular matrix.
-
-    Returns
-    -------
-    None.
-    """
-    with open(upper_matrix, 'r') as upper_handle, open(lower_matrix, 'r') as lower_handle:
-        upper_reader = csv.reader(upper_handle, delimiter='\t')
-        lower_reader = csv.reader(lower_handle, delimiter='\t')
-
-        merged_lines = []
-        for i in range(matrix_size):
-            upper_line = upper_reader.__next__()
-            lower_line = lower_reader.__next__()
-            merged_line = [e
-                           if e != ''
-                           else lower_line[i]
-                           for i, e in enumerate(upper_line)]
-            merged_lines.append(merged_line)
-
-            if len(merged_lines) >= 200 or i == (matrix_size-1):
-                merged_lines = [im.join_list(line, '\t') for line in merged_lines]
-                fo.write_lines(merged_lines, output_file, joiner='\n', write_mode='a')
-                merged_lines = []
-
-
-def symmetrify_matrix(input_matrix, matrix_size, tmp_directory):
-    """Symmetrify a triangular matrix.
-
-    Parameters
-    ----------
-    input_matrix : str
-        Path to TSV file that contains the triangular matrix.
-    matrix_size : int
-        Total number of lines in input file.
-    tmp_directory : str
-        Path to the output temporary directory.
-
-    Returns
-    -------
-    symmetric_output : str
-        Path to the output file that contains the symmetric
-        matrix.
-    """
-    output_transpose = transpose_matrix(input_matrix, tmp_directory)
-
-    # merge upper and lower diagonal matrices into symmetric matrix
-    symmetric_output = input_matrix.replace('.tsv', '_symmetric.tsv')
-
-    merge_triangular_matrices(input_matrix, output_transpose,
-                              symmetric_output, matrix_size)
-
-    # delete files with triangular matrices
-    os.remove(input_matrix)
-    os.remove(output_transpose)
-
-    return symmetric_output
-
-
 def main(input_matrix, output_directory, cpu_cores, symmetric, masked):
     """Compute a distance matrix based on allelic profiles.
 
@@ -376,56 +362,100 @@ def main(input_matrix, output_directory, cpu_cores, symmetric, masked):
         masked_profiles = profiles_matrix.apply(im.replace_chars)
         masked_profiles.to_csv(output_masked, sep='\t')
         print('masked matrix available at {0}'.format(output_masked))
+        # build array from the masked profiles instead of reading the file
+        np_matrix = np.ascontiguousarray(masked_profiles.astype('int32').to_numpy())
+        del profiles_matrix, masked_profiles
     else:
-        output_masked = input_matrix
+        np_matrix = tsv_to_nparray(input_matrix)
 
-    # create temp directory to store pairwise distances per genome
+    # create temp directory to store intermediate files
     tmp_directory = os.path.join(output_directory, 'temp', 'pairwise_distances')
     if os.path.isdir(tmp_directory) is False:
         os.mkdir(tmp_directory)
 
     # get sample identifiers
     genome_ids = get_sample_ids(input_matrix, delimiter='\t')
-    total_genomes = len(genome_ids)
 
-    np_matrix = tsv_to_nparray(output_masked)
+    # distances only compare allele identifiers, use uint16 if all
+    # identifiers fit to halve the memory read when computing distances
+    if np_matrix.max(initial=0) <= np.iinfo(np.uint16).max:
+        np_matrix = np_matrix.astype(np.uint16)
+
+    # exclude loci that cannot contribute to any distance, loci without
+    # allele identifiers or with the same identifier in all samples
+    present = np_matrix != 0
+    first_allele = np_matrix[present.argmax(axis=0), np.arange(np_matrix.shape[1])]
+    variable_loci = ((np_matrix != first_allele) & present).any(axis=0)
+    del present
+    if not variable_loci.all():
+        np_matrix = np.ascontiguousarray(np_matrix[:, variable_loci])
+
+    # only compute distances once for samples with identical profiles
+    unique_matrix, inverse = np.unique(np_matrix, axis=0, return_inverse=True)
+    if len(unique_matrix) < len(np_matrix):
+        np_matrix = unique_matrix
+        inverse = inverse.reshape(-1)
+    else:
+        inverse = None
+    del unique_matrix
+    total_rows = len(np_matrix)
 
-    rows_indexes = [i for i in range(len(np_matrix))]
+    rows_indexes = [i for i in range(total_rows)]
     random.shuffle(rows_indexes)
-    # divide inputs into 20 lists for 5% progress resolution
-    parallel_inputs = im.divide_list_into_n_chunks(rows_indexes, 20)
+    # workers attach to the shared arrays once, divide inputs into small
+    # lists of rows for a more balanced distribution between workers
+    parallel_inputs = im.divide_list_into_n_chunks(rows_indexes,
+                                                   math.ceil(total_rows/32))
+
+    # copy matrix to shared memory to avoid pickling it for every task
+    matrix_shm = shared_memory.SharedMemory(create=True, size=max(np_matrix.nbytes, 1))
+    shared_matrix = np.ndarray(np_matrix.shape, dtype=np_matrix.dtype, buffer=matrix_shm.buf)
+    shared_matrix[:] = np_matrix[:]
+    matrix_shape = np_matrix.shape
+    matrix_dtype = np_matrix.dtype.str
+    del np_matrix
+
+    # condensed matrix that stores the distances above the diagonal
+    # memory-mapped file avoids keeping all distances in memory
+    total_pairs = total_rows*(total_rows-1)//2
+    distances_file = os.path.join(tmp_directory, 'distances.npy')
+    distances = np.lib.format.open_memmap(distances_file, mode='w+',
+                                          dtype='int32', shape=(total_pairs,))
+    del distances
+
+    common_args = [[l, shared_compute_distances] for l in parallel_inputs]
 
-    common_args = [[l, np_matrix, genome_ids, tmp_directory, compute_distances]
-                   for l in parallel_inputs]
-
-    # increasing cpu cores can greatly increase memory usage
     print('Computing pairwise distances...')
-    results = mo.map_async_parallelizer(common_args,
-                                        mo.function_helper,
-                                        cpu_cores,
-                                        show_progress=True)
-
-    merged = im.merge_dictionaries(results)
+    try:
+        mo.map_async_parallelizer(common_args,
+                                  mo.function_helper,
+                                  cpu_cores,
+                                  show_progress=True,
+                                  initializer=attach_shared_arrays,
+                                  initargs=(matrix_shm.name, matrix_shape,
+                                            matrix_dtype, distances_file))
+    finally:
+        del shared_matrix
+        matrix_shm.close()
+        matrix_shm.unlink()
 
     print('\nCreating distance matrix...', end='')
     # create files with headers
     col_ids = ['FILE'] + genome_ids
     output_pairwise = os.path.join(output_directory, ct.DISTANCE_MATRIX_BASENAME)
+    if symmetric is True:
+        output_pairwise = output_pairwise.replace('.tsv', '_symmetric.tsv')
     # output_p = os.path.join(output_directory,
     #                         '{0}_shared_loci.tsv'.format(input_basename))
 
-    # Import arrays per genome and save to matrix file
-    # results = write_matrices(merged, genome_ids, output_pairwise, output_p, col_ids)
-    results = write_matrices(merged, genome_ids, output_pairwise, col_ids)
-
-    if symmetric is True:
-        # add 1 to include header
-        output_pairwise = symmetrify_matrix(output_pairwise,
-                                            len(genome_ids)+1,
-                                            tmp_directory)
-        # output_p = symmetrify_matrix(output_p,
-        #                              len(genome_ids)+1,
-        #                              tmp_directory)
+    # save distances to matrix file
+    # results = write_matrices(distances, genome_ids, output_pairwise, output_p,
+    #                          col_ids, symmetric, inverse)
+    distances = np.lib.format.open_memmap(distances_file, mode='r')
+    write_matrices(distances, genome_ids, output_pairwise, col_ids,
+                   symmetric, inverse)
+    del distances
+    os.remove(distances_file)
 
     print('done.')
 
@@ -11,6 +11,8 @@ Code documentation
 """
 
 
+from multiprocessing.pool import ThreadPool
+
 from Bio import SeqIO
 from Bio.SeqIO import FastaIO
 
@@ -46,6 +48,31 @@ def sequence_generator(input_file):
     return records
 
 
+def sequence_tuples(input_file):
+    """Create an iterator over the identifiers and sequences in a FASTA file.
+
+    Uses Biopython's SimpleFastaParser, which does not create
+    SeqRecord objects and is much faster than `sequence_generator`
+    when only the identifier and sequence are needed.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to a FASTA file.
+
+    Returns
+    -------
+    records : generator
+        Generator that yields tuples with a sequence identifier
+        (first word in the header) and the sequence string.
+    """
+    with open(input_file, 'r') as infile:
+        for title, sequence in FastaIO.SimpleFastaParser(infile):
+            # Same identifier as the SeqRecord.id attribute
+            seqid = title.split(None, 1)[0] if title else ''
+            yield (seqid, sequence)
+
+
 def index_fasta(fasta_file):
     """Create index to retrieve data from a FASTA file.
 
@@ -78,9 +105,8 @@ def import_sequences(input_file):
         Dictionary with sequence identifiers as keys and
         sequences as values.
     """
-    records = sequence_generator(input_file)
-    # Only want record identifier and sequence, no need to use SeqIO.to_dict
-    records_dict = {rec.id: str(rec.seq.upper()) for rec in records}
+    records_dict = {seqid: sequence.upper()
+                    for seqid, sequence in sequence_tuples(input_file)}
 
     return records_dict
 
@@ -152,14 +178,14 @@ def integer_headers(input_fasta, output_fasta, start=1,
     seqs = []
     ids_map = {}
     exhausted = False
-    seq_generator = sequence_generator(input_fasta)
+    seq_generator = sequence_tuples(input_fasta)
     while exhausted is False:
         record = next(seq_generator, None)
         if record is not None:
             # new_id = 'seq_{0}'.format(start)
             new_id = '{0}{1}'.format(prefix, start)
-            ids_map[new_id] = record.id
-            sequence = str(record.seq)
+            seqid, sequence = record
+            ids_map[new_id] = seqid
             new_rec = fasta_str_record(ct.FASTA_RECORD_TEMPLATE,
                                        [new_id, sequence])
             seqs.append(new_rec)
@@ -232,28 +258,38 @@ def validate_fasta(file_path):
     True if file has valid FASTA format,
     False otherwise.
     """
-    # Empty list if file is empty or has any problem
-    # Need to convert to list to exhaust generator
-    # Otherwise it might increase memory usage
-    records = list(sequence_generator(file_path))
+    # Only the first block of the file is read
+    # A FASTA file must start with a header line
+    with open(file_path, 'rb') as infile:
+        head = infile.read(4096)
 
-    return any(records)
+    return head.lstrip().startswith(b'>')
 
 
-def filter_non_fasta(files):
+def filter_non_fasta(files, workers=32):
     """Select FASTA files from a list with file paths.
 
     Parameters
     ----------
     files : list
         A list that contains file paths.
+    workers : int
+        Maximum number of threads used to validate files.
 
     Returns
     -------
     fasta_files : list
         List that contains paths to FASTA files.
     """
-    fasta_files = [file for file in files if validate_fasta(file) is True]
+    # Validation is mostly waiting on file reads, threads overlap them
+    workers = min(workers, len(files))
+    if workers > 1:
+        with ThreadPool(processes=workers) as pool:
+            valid = pool.map(validate_fasta, files, chunksize=64)
+    else:
+        valid = [validate_fasta(file) for file in files]
+
+    fasta_files = [file for file, is_fasta in zip(files, valid) if is_fasta is True]
 
     invalid_files = list(set(files)-set(fasta_files))
 
@@ -281,12 +317,12 @@ def sequence_lengths(fasta_file, hashed=False):
         Dictionary with sequence identifiers as keys and
         sequence lengths as values.
     """
-    records = sequence_generator(fasta_file)
+    records = sequence_tuples(fasta_file)
     if hashed is False:
-        lengths = {rec.id: len(rec.seq) for rec in records}
+        lengths = {seqid: len(sequence) for seqid, sequence in records}
     else:
-        lengths = {im.hash_sequence(str(rec.seq)):
-                   len(rec.seq) for rec in records}
+        lengths = {im.hash_sequence(sequence): len(sequence)
+                   for seqid, sequence in records}
 
     return lengths
 
@@ -346,6 +382,54 @@ def get_sequences_by_id(sequences, seqids, output_file, limit=50000):
     return total_selected
 
 
+def stream_sequences_by_id(fasta_files, seqids, output_file, limit=50000):
+    """Retrieve sequences from FASTA files in a single pass.
+
+    Reads the FASTA files sequentially and writes the records
+    whose identifier is in `seqids`, keeping the order in which
+    the records appear in the input files. Avoids concatenating
+    and indexing the files when every selected record would be
+    fetched anyway.
+
+    Parameters
+    ----------
+    fasta_files : list
+        List with paths to FASTA files.
+    seqids : list
+        List with the identifiers of the sequences that should be
+        retrieved.
+    output_file : str
+        Path to the FASTA file to which selected sequences will
+        be saved.
+    limit : int
+        Maximum number of sequences that will be kept in memory
+        at a time (to avoid keeping huge datasets in memory).
+
+    Returns
+    -------
+    total_selected : int
+        Total number of records written to the output file.
+    """
+    selected = set(seqids)
+    records = []
+    total_selected = 0
+    for file in fasta_files:
+        for seqid, sequence in sequence_tuples(file):
+            if seqid in selected:
+                records.append(fasta_str_record(ct.FASTA_RECORD_TEMPLATE,
+                                                [seqid, sequence]))
+                if len(records) == limit:
+                    fo.write_lines(records, output_file, write_mode='a')
+                    total_selected += len(records)
+                    records = []
+
+    if len(records) > 0:
+        fo.write_lines(records, output_file, write_mode='a')
+        total_selected += len(records)
+
+    return total_selected
+
+
 def split_seqcount(fasta_path, output_directory, max_seqs):
     """Split a FASTA file based on a maximum number of sequences per file.
 
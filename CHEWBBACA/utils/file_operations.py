@@ -18,6 +18,7 @@ import os
 import sys
 import csv
 import math
+import mmap
 import time
 import gzip
 import shutil
@@ -30,8 +31,6 @@ from collections import Counter
 from multiprocessing import TimeoutError
 from multiprocessing.pool import ThreadPool
 
-import pandas as pd
-
 try:
     from utils import iterables_manipulation as im
     from utils import constants as ct
@@ -87,9 +86,12 @@ def remove_files(files):
             os.remove(f)
 
 
-def hash_file(file, hash_object, buffer_size=65536):
+def hash_file(file, hash_object):
     """Compute hash based on the contents of a file.
 
+    The file is memory-mapped and passed to the hash object
+    in a single update call.
+
     Parameters
     ----------
     file : str
@@ -97,9 +99,6 @@ def hash_file(file, hash_object, buffer_size=65536):
     hash_object : _hashlib.HASH
         Hashlib object to update based on file
         contents.
-    buffer_size : int
-        Buffer size (amount of data, in KB, to
-        read from file).
 
     Returns
     -------
@@ -109,12 +108,10 @@ def hash_file(file, hash_object, buffer_size=65536):
     updated_hash = hash_object
 
     with open(file, 'rb') as f:
-        # read file in chunks
-        while True:
-            data = f.read(buffer_size)
-            if not data:
-                break
-            updated_hash.update(data)
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                updated_hash.update(mm)
 
     hash_str = updated_hash.hexdigest()
 
@@ -168,13 +165,49 @@ def filter_by_extension(files, extensions):
         List with files that do not end with one of the provided
         file extensions.
     """
-    has_extension = [file for file in files
-                     if any([file.endswith(ext) for ext in extensions])]
+    # str.endswith tests all extensions in a single call
+    extensions = tuple(extensions)
+    has_extension = [file for file in files if file.endswith(extensions)]
     no_extension = list(set(files)-set(has_extension))
 
     return has_extension, no_extension
 
 
+def missing_files(file_paths):
+    """Determine which paths in a list do not exist.
+
+    Lists each parent directory once instead of checking
+    every path individually.
+
+    Parameters
+    ----------
+    file_paths : list
+        List with file paths.
+
+    Returns
+    -------
+    missing : list
+        List with the paths that do not exist.
+    """
+    directory_entries = {}
+    for file in file_paths:
+        parent_dir = os.path.dirname(file)
+        if parent_dir not in directory_entries:
+            try:
+                with os.scandir(parent_dir or '.') as entries:
+                    directory_entries[parent_dir] = {entry.name for entry in entries}
+            except OSError:
+                directory_entries[parent_dir] = set()
+
+    # Confirm paths not found in the listings with os.path.exists
+    # (e.g. case-insensitive file systems or paths with symlinks)
+    missing = [file for file in file_paths
+               if os.path.basename(file) not in directory_entries[os.path.dirname(file)]
+               and os.path.exists(file) is False]
+
+    return missing
+
+
 def create_directory(directory_path):
     """Create a diretory if it does not exist."""
     if not os.path.exists(directory_path):
@@ -307,7 +340,33 @@ def read_lines(input_file, strip=True, num_lines=None):
     return lines
 
 
-def pickle_dumper(content, output_file):
+def read_path_list(input_file):
+    """Read a file with one file path per line.
+
+    The file is read and split into lines in a single pass,
+    which is faster than iterating over the lines of very large
+    lists. Only the first tab-delimited field of each line is
+    kept and empty lines are ignored.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to the file with the list of paths.
+
+    Returns
+    -------
+    paths : list
+        List with the paths read from the input file.
+    """
+    with open(input_file, 'r') as infile:
+        lines = infile.read().splitlines()
+
+    paths = [line.split('\t', 1)[0] for line in lines if line.strip()]
+
+    return paths
+
+
+def pickle_dumper(content, output_file, protocol=ct.PICKLE_PROTOCOL):
     """Use the Pickle module to serialize an object.
 
     Parameters
@@ -317,9 +376,11 @@ def pickle_dumper(content, output_file):
         be serialized and written to the output file.
     output_file : str
         Path to the output file.
+    protocol : int
+        Pickle protocol used to serialize the object.
     """
     with open(output_file, 'wb') as poutfile:
-        pickle.dump(content, poutfile)
+        pickle.dump(content, poutfile, protocol=protocol)
 
 
 def pickle_loader(input_file):
@@ -439,16 +500,49 @@ def concatenate_files(files, output_file, header=None):
         Path to the output file that was created with
         the concatenation of input files.
     """
-    with open(output_file, 'w') as outfile:
+    with open(output_file, 'wb') as outfile:
         if header is not None:
-            outfile.write(header)
+            outfile.write(header.encode())
         for file in files:
-            with get_reader(file) as infile:
-                shutil.copyfileobj(infile, outfile)
+            with open(file, 'rb') as infile:
+                send_file(infile, outfile)
 
     return output_file
 
 
+def send_file(infile, outfile):
+    """Append the contents of a file object to another file object.
+
+    Uses `os.sendfile` to copy the data in the kernel and falls
+    back to `shutil.copyfileobj` if it is unavailable or fails.
+
+    Parameters
+    ----------
+    infile : file object
+        File object opened in binary mode to read from.
+    outfile : file object
+        File object opened in binary mode to write to.
+    """
+    if hasattr(os, 'sendfile'):
+        # Write buffered data before writing directly to the descriptor
+        outfile.flush()
+        offset = 0
+        remaining = os.fstat(infile.fileno()).st_size
+        try:
+            while remaining > 0:
+                sent = os.sendfile(outfile.fileno(), infile.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except OSError:
+            pass
+        # Copy whatever could not be sent
+        infile.seek(offset)
+
+    shutil.copyfileobj(infile, outfile)
+
+
 def write_to_file(text, output_file, write_mode, end_char):
     """Write a single string to a file.
 
@@ -607,6 +701,41 @@ def copy_file(source, destination):
     """Copy a file to specified destination."""
     shutil.copy(source, destination)
 
+
+def hash_and_copy_file(source, destination, hash_object):
+    """Copy a file and compute its hash in a single read pass.
+
+    Parameters
+    ----------
+    source : str
+        Path to the file to copy.
+    destination : str
+        Path to the destination file or directory.
+    hash_object : _hashlib.HASH
+        Hashlib object to update based on file
+        contents.
+
+    Returns
+    -------
+    hash_str : str
+        Hash computed from file contents.
+    """
+    if os.path.isdir(destination):
+        destination = join_paths(destination, [os.path.basename(source)])
+
+    with open(source, 'rb') as infile, open(destination, 'wb') as outfile:
+        # Empty files cannot be memory-mapped
+        if os.fstat(infile.fileno()).st_size > 0:
+            with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hash_object.update(mm)
+                outfile.write(mm)
+    shutil.copymode(source, destination)
+
+    hash_str = hash_object.hexdigest()
+
+    return hash_str
+
+
 def move_file(source, destination):
     """Move a file to specified destination."""
     shutil.move(source, destination)
@@ -651,6 +780,9 @@ def transpose_matrix(input_file, output_directory):
         This file is created by concatenating all
         intermediate files.
     """
+    # Imported here to avoid loading pandas for every module
+    import pandas as pd
+
     intermediate_files = []
     with get_reader(input_file) as infile:
         # Get column identifiers
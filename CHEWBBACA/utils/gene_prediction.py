@@ -203,8 +203,8 @@ def predict_genome_genes(input_file, output_directory, gene_finder,
     """
     # Get genome unique identifier
     genome_basename = input_file[1]
-    records = fao.sequence_generator(input_file[0])
-    records = {rec.id: bytes(rec.seq) for rec in records}
+    records = {seqid: sequence.encode()
+               for seqid, sequence in fao.sequence_tuples(input_file[0])}
     contig_sizes = {recid: len(sequence)
                     for recid, sequence in records.items()}
 
@@ -139,8 +139,10 @@ def merge_dictionaries(dictionaries_list, overwrite=False):
     """
     merged_dicts = dictionaries_list[0]
     if overwrite is True:
+        # Copy only once to avoid modifying the first dictionary
+        merged_dicts = dict(merged_dicts)
         for d in dictionaries_list[1:]:
-            merged_dicts = {**merged_dicts, **d}
+            merged_dicts.update(d)
     elif overwrite is False:
         for d in dictionaries_list[1:]:
             for k, v in d.items():
@@ -993,13 +995,13 @@ def replace_chars(column, missing_replace='0'):
 
     Parameters
     ----------
-    column : pandas.core.series.Series
-        Pandas dataframe column.
+    column : pandas.core.series.Series or pandas.core.frame.DataFrame
+        Pandas dataframe column or a whole dataframe.
 
     Returns
     -------
-    replace_missing : pandas.core.series.Series
-        Input column with cells that only contain
+    replace_missing : pandas.core.series.Series or pandas.core.frame.DataFrame
+        Input column or dataframe with cells that only contain
         numeric characters.
     """
     # remove 'INF-' from inferred alleles
@@ -51,7 +51,8 @@ def function_helper(input_args):
 
 
 def map_async_parallelizer(inputs, function, cpu, callback='extend',
-                           chunksize=1, show_progress=False, pool_type='pool'):
+                           chunksize=1, show_progress=False, pool_type='pool',
+                           initializer=None, initargs=()):
     """Run function in parallel.
 
     Parameters
@@ -78,6 +79,10 @@ def map_async_parallelizer(inputs, function, cpu, callback='extend',
     pool_type : str
         The multiprocessing.pool object that will be used,
         Pool or ThreadPool.
+    initializer : func or NoneType
+        Function called once by each worker when it starts.
+    initargs : tuple
+        Arguments passed to the initializer function.
 
     Returns
     -------
@@ -93,7 +98,7 @@ def map_async_parallelizer(inputs, function, cpu, callback='extend',
 
     results = []
     # Use context manager to join and close pool automatically
-    with multiprocessing_function(cpu) as pool:
+    with multiprocessing_function(cpu, initializer, initargs) as pool:
         if callback == 'extend':
             rawr = pool.map_async(function, inputs,
                                   callback=results.extend, chunksize=chunksize)
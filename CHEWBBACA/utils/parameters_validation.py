@@ -15,27 +15,29 @@ Code documentation
 import os
 import re
 import sys
+import json
 import shutil
 import hashlib
 import argparse
-import platform
+import functools
 import subprocess
-import multiprocessing
 
 try:
 	from utils import (constants as ct,
 					   file_operations as fo,
-					   chewiens_requests as cr,
 					   fasta_operations as fao,
 					   iterables_manipulation as im)
 except ModuleNotFoundError:
 	from CHEWBBACA.utils import (constants as ct,
 								 file_operations as fo,
-								 chewiens_requests as cr,
 								 fasta_operations as fao,
 								 iterables_manipulation as im)
 
 
+# Match the BLAST version in the bytes returned by 'blastp -version'
+BLAST_VERSION_PATTERN = re.compile(rb'^blastp:\s(?P<MAJOR>\d+)\.(?P<MINOR>\d+)\.(?P<REV>\d+).*')
+
+
 class ModifiedHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
 
 	# prog is the name of the program 'ex: chewBBACA.py'
@@ -44,7 +46,8 @@ class ModifiedHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
 
 	# Override split lines method
 	def _split_lines(self, text, width):
-		lines = super()._split_lines(text, width) + ['']
+		lines = super()._split_lines(text, width)
+		lines.append('')
 		return lines
 
 	def _format_action_invocation(self, action):
@@ -97,128 +100,83 @@ def arg_list(arg, arg_name):
 		- If more than one parameter value has been used to
 		perform allele calling.
 	"""
-	if isinstance(arg, list) is True:
+	if type(arg) is list:
 		if len(arg) > 1:
 			sys.exit('\nMultiple {0} values.'.format(arg_name))
-		else:
-			arg = arg[0]
+		arg = arg[0]
 
 	return arg
 
 
-def bsr_type(arg, min_value=ct.BSR_MIN, max_value=ct.BSR_MAX):
-	"""Validate the BLAST Score Ratio (BSR) value passed to chewBBACA.
+def _make_range_validator(arg_name, cast, lo, hi, range_message,
+						  type_message, null_args=(), null_value=None):
+	"""Create a function that validates a numeric parameter value.
 
 	Parameters
 	----------
-	arg : float
-		The BLAST Score Ratio (BSR) value passed to chewBBACA.
-	min_value : float
-		Minimum acceptable BSR value.
-	max_value : float
-		Maximum acceptable BSR value.
+	arg_name : str
+		Name of the parameter, used to report multiple values.
+	cast : type
+		Type the parameter value must be converted to (int or float).
+	lo : int or float
+		Default minimum acceptable value.
+	hi : int or float
+		Default maximum acceptable value.
+	range_message : str
+		Message displayed if the value is not contained in the
+		acceptable interval. Formatted with the minimum and maximum
+		acceptable values.
+	type_message : str
+		Message displayed if the value cannot be converted to the
+		expected type. Formatted with the parameter value.
+	null_args : tuple
+		Values that are accepted to indicate that the parameter
+		was not set.
+	null_value : None or str
+		Value returned if the parameter value is in `null_args`.
 
 	Returns
 	-------
-	valid : float
-		The BSR value passed to chewBBACA, if it is valid.
-
-	Raises
-	------
-	SystemExit
-		- If the BSR value cannot be converted to float type
-		or if it is not contained in the acceptable interval.
+	validator : func
+		Function that receives the parameter value and optional
+		minimum and maximum acceptable values and returns the
+		validated value. Exits if the value is not valid.
 	"""
-	arg = arg_list(arg, 'BLAST Score Ratio')
-
-	try:
-		schema_bsr = float(arg)
-		if schema_bsr >= min_value and schema_bsr <= max_value:
-			valid = schema_bsr
-		elif schema_bsr < min_value or schema_bsr > max_value:
-			sys.exit(ct.INVALID_BSR)
-	except Exception:
-		sys.exit(ct.INVALID_BSR_TYPE.format(arg))
-
-	return valid
-
+	def validator(arg, min_value=lo, max_value=hi):
+		arg = arg_list(arg, arg_name)
+		if arg in null_args:
+			return null_value
 
-def minimum_sequence_length_type(arg, min_value=ct.MSL_MIN, max_value=ct.MSL_MAX):
-	"""Validate the minimum sequence length value (MSL) passed to chewBBACA.
-
-	Parameters
-	----------
-	arg : int
-		The MSL value passed to chewBBACA.
-	min_value : int
-		Minimum acceptable MSL value.
-	max_value : int
-		Maximum acceptable MSL value.
+		try:
+			valid = cast(arg)
+		except (TypeError, ValueError):
+			sys.exit(type_message.format(arg))
 
-	Returns
-	-------
-	valid : int
-		The MSL value passed to chewBBACA, if it is valid.
+		if not min_value <= valid <= max_value:
+			sys.exit(range_message.format(min_value, max_value))
 
-	Raises
-	------
-	SystemExit
-		- If the MSL value cannot be converted to int type
-		or if it is not contained in the acceptable interval.
-	"""
-	arg = arg_list(arg, 'minimum sequence length')
+		return valid
 
-	try:
-		schema_ml = int(arg)
-		if schema_ml >= min_value and schema_ml <= max_value:
-			valid = schema_ml
-		elif schema_ml < min_value or schema_ml > max_value:
-			sys.exit(ct.INVALID_MINLEN)
-	except Exception:
-		sys.exit(ct.INVALID_MINLEN_TYPE)
+	return validator
 
-	return valid
 
+# Validate the BLAST Score Ratio (BSR) value passed to chewBBACA
+bsr_type = _make_range_validator('BLAST Score Ratio', float,
+								 ct.BSR_MIN, ct.BSR_MAX,
+								 ct.INVALID_BSR, ct.INVALID_BSR_TYPE)
 
-def size_threshold_type(arg, min_value=ct.ST_MIN, max_value=ct.ST_MAX):
-	"""Validate the size threshold value (ST) passed to chewBBACA.
+# Validate the minimum sequence length value (MSL) passed to chewBBACA
+minimum_sequence_length_type = _make_range_validator('minimum sequence length', int,
+													 ct.MSL_MIN, ct.MSL_MAX,
+													 ct.INVALID_MINLEN,
+													 ct.INVALID_MINLEN_TYPE)
 
-	Parameters
-	----------
-	arg : float
-		The ST value passed to chewBBACA. Must be of type float
-		or NoneType if no size threshold filter should be applied.
-	min_value : float
-		Minimum acceptable ST value.
-	max_value : float
-		Maximum acceptable ST value.
-
-	Returns
-	-------
-	valid : float
-		The ST value passed to chewBBACA, if it is valid.
-
-	Raises
-	------
-	SystemExit
-		- If the ST value cannot be converted to float type
-		or if it is not contained in the acceptable interval.
-	"""
-	arg = arg_list(arg, 'size threshold')
-
-	try:
-		schema_st = float(arg)
-		if schema_st >= min_value and schema_st <= max_value:
-			valid = schema_st
-		elif schema_st < min_value or schema_st > max_value:
-			sys.exit(ct.INVALID_ST)
-	except Exception:
-		if arg in [None, 'None']:
-			valid = None
-		else:
-			sys.exit(ct.INVALID_ST_TYPE)
-
-	return valid
+# Validate the size threshold value (ST) passed to chewBBACA
+# None disables the size threshold filter
+size_threshold_type = _make_range_validator('size threshold', float,
+											ct.ST_MIN, ct.ST_MAX,
+											ct.INVALID_ST, ct.INVALID_ST_TYPE,
+											null_args=(None, 'None'))
 
 
 def translation_table_type(arg, genetic_codes=ct.GENETIC_CODES):
@@ -266,167 +224,31 @@ def translation_table_type(arg, genetic_codes=ct.GENETIC_CODES):
 	return valid
 
 
-def validate_ws(arg, min_value=ct.WORD_SIZE_MIN, max_value=ct.WORD_SIZE_MAX):
-	"""Validate the word size value (WS) passed to chewBBACA.
-
-	Parameters
-	----------
-	arg : float
-		The WS value passed to chewBBACA.
-	min_value : float
-		Minimum acceptable WS value.
-	max_value : float
-		Maximum acceptable WS value.
-
-	Returns
-	-------
-	valid : float
-		The WS value passed to chewBBACA, if it is valid.
-
-	Raises
-	------
-	SystemExit
-		- If the WS value cannot be converted to float type
-		or if it is not contained in the acceptable interval.
-	"""
-	arg = arg_list(arg, 'word size')
-
-	try:
-		if arg is None:
-			valid = 'None'
-		else:
-			word_size = int(arg)
-			if word_size >= min_value and word_size <= max_value:
-				valid = word_size
-			else:
-				sys.exit(ct.INVALID_WS.format(min_value, max_value))
-	except Exception:
-		sys.exit(ct.INVALID_WS_TYPE)
-
-	return valid
-
-
-def validate_cs(arg, min_value=ct.CLUSTERING_SIMILARITY_MIN,
-				max_value=ct.CLUSTERING_SIMILARITY_MAX):
-	"""Validate the clustering similarity value (CS) passed to chewBBACA.
-
-	Parameters
-	----------
-	arg : float
-		The CS value passed to chewBBACA. Must be of type float.
-	min_value : float
-		Minimum acceptable CS value.
-	max_value : float
-		Maximum acceptable CS value.
-
-	Returns
-	-------
-	valid : float
-		The CS value passed to chewBBACA, if it is valid.
-
-	Raises
-	------
-	SystemExit
-		- If the CS value cannot be converted to float type
-		or if it is not contained in the acceptable interval.
-	"""
-	arg = arg_list(arg, 'clustering similarity')
-
-	try:
-		if arg is None:
-			valid = 'None'
-		else:
-			cluster_sim = float(arg)
-			if cluster_sim >= min_value and cluster_sim <= max_value:
-				valid = cluster_sim
-			else:
-				sys.exit(ct.INVALID_CS)
-	except Exception:
-		sys.exit(ct.INVALID_CS_TYPE)
-
-	return valid
-
-
-def validate_rf(arg, min_value=ct.REPRESENTATIVE_FILTER_MIN,
-				max_value=ct.REPRESENTATIVE_FILTER_MAX):
-	"""Validate the representative filter value (RF) passed to chewBBACA.
-
-	Parameters
-	----------
-	arg : float
-		The RF value passed to chewBBACA. Must be of type float.
-	min_value : float
-		Minimum acceptable RF value.
-	max_value : float
-		Maximum acceptable RF value.
-
-	Returns
-	-------
-	valid : float
-		The RF value passed to chewBBACA, if it is valid.
-
-	Raises
-	------
-	SystemExit
-		- If the RF value cannot be converted to float type
-		or if it is not contained in the acceptable interval.
-	"""
-	arg = arg_list(arg, 'representative filter')
-
-	try:
-		if arg is None:
-			valid = 'None'
-		else:
-			representative_filter = float(arg)
-			if representative_filter >= min_value and representative_filter <= max_value:
-				valid = representative_filter
-			else:
-				sys.exit(ct.INVALID_RF)
-	except Exception:
-		sys.exit(ct.INVALID_RF_TYPE)
-
-	return valid
+# Validate the word size value (WS) passed to chewBBACA
+validate_ws = _make_range_validator('word size', int,
+									ct.WORD_SIZE_MIN, ct.WORD_SIZE_MAX,
+									ct.INVALID_WS, ct.INVALID_WS_TYPE,
+									null_args=(None,), null_value='None')
 
+# Validate the clustering similarity value (CS) passed to chewBBACA
+validate_cs = _make_range_validator('clustering similarity', float,
+									ct.CLUSTERING_SIMILARITY_MIN,
+									ct.CLUSTERING_SIMILARITY_MAX,
+									ct.INVALID_CS, ct.INVALID_CS_TYPE,
+									null_args=(None,), null_value='None')
 
-def validate_if(arg, min_value=ct.INTRA_CLUSTER_MIN,
-				max_value=ct.INTRA_CLUSTER_MAX):
-	"""Validate the intra-cluster filter value (IF) passed to chewBBACA.
+# Validate the representative filter value (RF) passed to chewBBACA
+validate_rf = _make_range_validator('representative filter', float,
+									ct.REPRESENTATIVE_FILTER_MIN,
+									ct.REPRESENTATIVE_FILTER_MAX,
+									ct.INVALID_RF, ct.INVALID_RF_TYPE,
+									null_args=(None,), null_value='None')
 
-	Parameters
-	----------
-	arg : float
-		The IF value passed to chewBBACA. Must be of type float.
-	min_value : float
-		Minimum acceptable IF value.
-	max_value : float
-		Maximum acceptable IF value.
-
-	Returns
-	-------
-	valid : float
-		The IF value passed to chewBBACA, if it is valid.
-
-	Raises
-	------
-	SystemExit
-		- If the IF value cannot be converted to float type
-		or if it is not contained in the acceptable interval.
-	"""
-	arg = arg_list(arg, 'intra-cluster filter')
-
-	try:
-		if arg is None:
-			valid = 'None'
-		else:
-			intraCluster_filter = float(arg)
-			if intraCluster_filter >= min_value and intraCluster_filter <= max_value:
-				valid = intraCluster_filter
-			else:
-				sys.exit(ct.INVALID_ICF)
-	except Exception:
-		sys.exit(ct.INVALID_ICF_TYPE)
-
-	return valid
+# Validate the intra-cluster filter value (IF) passed to chewBBACA
+validate_if = _make_range_validator('intra-cluster filter', float,
+									ct.INTRA_CLUSTER_MIN, ct.INTRA_CLUSTER_MAX,
+									ct.INVALID_ICF, ct.INVALID_ICF_TYPE,
+									null_args=(None,), null_value='None')
 
 
 def validate_ns_url(arg):
@@ -456,6 +278,11 @@ def validate_ns_url(arg):
 
 	# sync schema has None by default to get ns_url in schema URI
 	if ns_url is not None:
+		# Only the Chewie-NS modules need the requests package
+		try:
+			from utils import chewiens_requests as cr
+		except ModuleNotFoundError:
+			from CHEWBBACA.utils import chewiens_requests as cr
 		# check if server is up
 		conn = cr.check_connection(ns_url)
 		if conn is False:
@@ -485,12 +312,11 @@ def validate_python_version(minimum_version=ct.MIN_PYTHON):
 		- If the Python version does not meet minimum requirements
 		or it was not possible to determine/detect a version.
 	"""
-	python_version = platform.python_version()
+	# sys.version_info already holds the version numbers
+	python_version = '{0}.{1}.{2}'.format(*sys.version_info[:3])
 
-	try:
-		assert tuple(map(int, python_version.split('.'))) >= minimum_version[0]
-	except AssertionError:
-		sys.exit(ct.PYTHON_VERSION.formta(python_version, minimum_version[1]))
+	if sys.version_info < minimum_version[0]:
+		sys.exit(ct.PYTHON_VERSION.format(python_version, minimum_version[1]))
 
 	return python_version
 
@@ -509,7 +335,12 @@ def verify_cpu_usage(cpu_to_use):
 		Value of CPU cores/threads that will be used after
 		determining if the provided value was safe.
 	"""
-	total_cpu = multiprocessing.cpu_count()
+	# Count the cores this process is allowed to run on (e.g. when
+	# limited by taskset or a container), if the platform supports it
+	if hasattr(os, 'sched_getaffinity'):
+		total_cpu = len(os.sched_getaffinity(0))
+	else:
+		total_cpu = os.cpu_count()
 
 	cpu_to_use = int(cpu_to_use)
 
@@ -543,6 +374,8 @@ def is_exe(fpath):
 	return os.path.isfile(fpath) and os.access(fpath, os.X_OK)
 
 
+# BLAST path and version do not change during a run
+@functools.lru_cache(maxsize=8)
 def get_blast_path(blast_path):
 	"""Determines if BLAST is in PATH.
 
@@ -576,6 +409,8 @@ def get_blast_path(blast_path):
 	return blast_path
 
 
+# Avoid running 'blastp -version' again after argument validation
+@functools.lru_cache(maxsize=8)
 def get_blast_version(blast_path):
 	"""Determines BLAST version.
 
@@ -594,20 +429,18 @@ def get_blast_version(blast_path):
 	blastp_path = fo.join_paths(blast_path, [ct.BLASTP_ALIAS])
 	# Check BLAST version
 	try:
-		proc = subprocess.Popen([blastp_path, '-version'],
-								stdout=subprocess.PIPE,
-								stderr=subprocess.PIPE)
-		stdout, stderr = proc.communicate()
-		version_string = stdout.decode('utf8')
-		version_pattern = r'^blastp:\s(?P<MAJOR>\d+).(?P<MINOR>\d+).(?P<REV>\d+).*'
-		blast_version_pat = re.compile(version_pattern)
-
-		match = blast_version_pat.search(version_string)
-		if match is not None:
-			version = {k: int(v) for k, v in match.groupdict().items()}
-		else:
-			version = None
-	except:
+		proc = subprocess.run([blastp_path, '-version'],
+							  stdout=subprocess.PIPE,
+							  stderr=subprocess.DEVNULL,
+							  timeout=ct.BLAST_VERSION_TIMEOUT,
+							  check=False)
+	except (subprocess.TimeoutExpired, OSError):
+		return None
+
+	match = BLAST_VERSION_PATTERN.search(proc.stdout)
+	if match is not None:
+		version = {k: int(v) for k, v in match.groupdict().items()}
+	else:
 		version = None
 
 	return version
@@ -709,9 +542,14 @@ def validate_ptf_path(ptf_path, schema_directory):
 	"""
 	if ptf_path is None:
 		# Deal with multiple training files
-		schema_ptfs = [file
-					   for file in os.listdir(schema_directory)
-					   if file.endswith('.trn')]
+		# Stop scanning the schema directory after finding two training files
+		schema_ptfs = []
+		with os.scandir(schema_directory) as entries:
+			for entry in entries:
+				if entry.name.endswith('.trn') and entry.is_file():
+					schema_ptfs.append(entry.name)
+					if len(schema_ptfs) > 1:
+						break
 		if len(schema_ptfs) > 1:
 			sys.exit(ct.MULTIPLE_PTFS)
 		elif len(schema_ptfs) == 1:
@@ -880,7 +718,7 @@ def solve_conflicting_arguments(schema_params, ptf_path, blast_score_ratio,
 	# determine user provided arguments values that differ from default
 	unmatch_params = {k: v
 					  for k, v in run_params.items()
-					  if v not in schema_params[k] and v is not None}
+					  if v is not None and v not in schema_params[k]}
 	# determine arguments values not provided by user
 	default_params = {k: schema_params[k][0]
 					  for k, v in run_params.items()
@@ -928,6 +766,149 @@ def solve_conflicting_arguments(schema_params, ptf_path, blast_score_ratio,
 	return run_params
 
 
+def arguments_cache_key(schema_directory, config_file, ptf_path,
+						blast_score_ratio, translation_table,
+						minimum_length, size_threshold):
+	"""Compute the key used to store validated arguments in the cache file.
+
+	Parameters
+	----------
+	schema_directory : str
+		Path to the schema's directory.
+	config_file : str
+		Path to the schema's configuration file.
+	ptf_path : str or NoneType
+		Path to the Prodigal training file passed through the
+		command line.
+	blast_score_ratio : float or NoneType
+		BLAST Score Ratio value passed through the command line.
+	translation_table : int or NoneType
+		Translation table value passed through the command line.
+	minimum_length : int or NoneType
+		Minimum sequence length value passed through the command line.
+	size_threshold : float or NoneType
+		Size threshold value passed through the command line.
+
+	Returns
+	-------
+	key : str
+		BLAKE2b hexdigest (32 characters) computed from the
+		schema's path, the contents of the schema's configuration
+		file and the argument values.
+	"""
+	cli_args = (os.path.abspath(schema_directory), ptf_path, blast_score_ratio,
+				translation_table, minimum_length, size_threshold)
+	key = hashlib.blake2b(repr(cli_args).encode(), digest_size=16)
+	with open(config_file, 'rb') as infile:
+		key.update(infile.read())
+
+	return key.hexdigest()
+
+
+def arguments_cache_file():
+	"""Get the path to the file that stores validated arguments.
+
+	Returns
+	-------
+	cache_file : str
+		Path to the cache file in the user's cache directory
+		($XDG_CACHE_HOME or ~/.cache).
+	"""
+	cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+	cache_file = os.path.join(cache_dir, 'chewBBACA', ct.ARGUMENTS_CACHE_BASENAME)
+
+	return cache_file
+
+
+def file_mtime(file_path):
+	"""Get the modification time of a file in nanoseconds.
+
+	Parameters
+	----------
+	file_path : str or NoneType
+		Path to a file.
+
+	Returns
+	-------
+	The modification time in nanoseconds or NoneType if
+	the path is NoneType or does not exist.
+	"""
+	if file_path is None or os.path.isfile(file_path) is False:
+		return None
+
+	return os.stat(file_path).st_mtime_ns
+
+
+def read_arguments_cache(schema_directory, cache_key, ptf_path):
+	"""Get validated arguments stored by a previous run with the same values.
+
+	Parameters
+	----------
+	schema_directory : str
+		Path to the schema's directory.
+	cache_key : str
+		Key computed by `arguments_cache_key`.
+	ptf_path : str or NoneType
+		Path to the Prodigal training file passed through the
+		command line.
+
+	Returns
+	-------
+	run_params : dict or NoneType
+		Dictionary with the validated argument values or NoneType
+		if there is no valid entry for the key (the selected training
+		file changed since the entry was stored).
+	"""
+	try:
+		with open(arguments_cache_file(), 'r') as infile:
+			cache = json.load(infile)
+		ptf_mtime, run_params = cache[cache_key]
+	except (OSError, ValueError, KeyError, TypeError):
+		return None
+
+	# Training file selection is cheap and must still exit if there
+	# are multiple training files in the schema's directory
+	if validate_ptf_path(ptf_path, schema_directory) != run_params['ptf_path']:
+		return None
+	if ptf_mtime != file_mtime(run_params['ptf_path']):
+		return None
+
+	return run_params
+
+
+def write_arguments_cache(cache_key, run_params):
+	"""Store validated arguments to skip validation on repeated runs.
+
+	Parameters
+	----------
+	cache_key : str
+		Key computed by `arguments_cache_key`.
+	run_params : dict
+		Dictionary with the validated argument values returned
+		by `solve_conflicting_arguments`.
+	"""
+	cache_file = arguments_cache_file()
+	try:
+		with open(cache_file, 'r') as infile:
+			cache = json.load(infile)
+	except (OSError, ValueError):
+		cache = {}
+
+	cache[cache_key] = (file_mtime(run_params['ptf_path']), run_params)
+
+	# Write to temporary file and rename to avoid partial reads
+	# by concurrent processes
+	tmp_file = f'{cache_file}.{os.getpid()}'
+	try:
+		os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+		with open(tmp_file, 'w') as outfile:
+			json.dump(cache, outfile)
+		os.replace(tmp_file, cache_file)
+	# Cache directory might not be writable
+	except OSError:
+		fo.remove_files([tmp_file])
+
+
 def write_gene_list(schema_dir):
 	"""Save list of loci in a schema to the '.genes_list' file.
 
@@ -947,11 +928,36 @@ def write_gene_list(schema_dir):
 	schema_files = os.listdir(schema_dir)
 	loci_files, _ = fo.filter_by_extension(schema_files, ['.fasta'])
 	output_file = fo.join_paths(schema_dir, [ct.GENE_LIST_BASENAME])
-	fo.pickle_dumper(loci_files, output_file)
+	fo.write_lines(sorted(loci_files), output_file)
 
 	return [os.path.isfile(output_file), output_file]
 
 
+def read_gene_list(gene_list_file):
+	"""Read list of loci in a schema from the '.genes_list' file.
+
+	Parameters
+	----------
+	gene_list_file : str
+		Path to the '.genes_list' file.
+
+	Returns
+	-------
+	loci_files : list
+		List with the basenames of the loci FASTA files.
+	"""
+	with open(gene_list_file, 'rb') as infile:
+		content = infile.read()
+
+	# Schemas created by previous versions store a pickled list
+	if content.startswith(b'\x80'):
+		return fo.pickle_loader(gene_list_file)
+
+	loci_files = [line for line in content.decode('utf-8').splitlines() if line]
+
+	return loci_files
+
+
 def write_schema_config(args, chewie_version, output_directory):
 	""" Writes chewBBACA's parameter values used to create
 		a schema to a file.
@@ -1029,6 +1035,31 @@ def read_configs(schema_path, filename):
 	return configs
 
 
+def report_files(files, max_files=ct.MAX_REPORTED_FILES):
+	"""Select the file paths to list in an error message.
+
+	Parameters
+	----------
+	files : list
+		List with the paths to the invalid files.
+	max_files : int
+		Maximum number of paths to list.
+
+	Returns
+	-------
+	reported : list
+		List with up to `max_files` paths and a line with
+		the number of paths that were not listed.
+	"""
+	if len(files) <= max_files:
+		return files
+
+	reported = files[:max_files]
+	reported.append('...and {0} more.'.format(len(files)-max_files))
+
+	return reported
+
+
 def check_input_type(input_path, output_file):
 	"""Validate input and create list of files to use.
 
@@ -1096,7 +1127,7 @@ def validate_input_file(input_path, output_file):
 		sys.exit(ct.FASTA_INPUT_EXCEPTION)
 
 	# Read list of input files
-	files = [line[0] for line in fo.read_tabular(input_path)]
+	files = fo.read_path_list(input_path)
 
 	invalid_files = []
 	# Need to verify if files end with any of the accepted file
@@ -1106,18 +1137,21 @@ def validate_input_file(input_path, output_file):
 		invalid_files.append([invalid_extension, ct.INVALID_EXTENSION_EXCEPTION])
 
 	# Check that all files exist
-	missing = [file for file in files if os.path.exists(file) is False]
+	missing = fo.missing_files(files)
 	if len(missing) > 0:
 		invalid_files.append([missing, ct.MISSING_INPUTS_EXCEPTION])
 
 	# Only keep files whose content is typical of a FASTA file
-	fasta_files, non_fasta = fao.filter_non_fasta(files)
+	# Missing files were already reported and cannot be read
+	missing = set(missing)
+	fasta_files, non_fasta = fao.filter_non_fasta([file for file in files
+												   if file not in missing])
 	if len(non_fasta) > 0:
 		invalid_files.append([non_fasta, ct.NON_FASTA_EXCEPTION])
 
 	# Exit if list of input files contained invalid files
 	if len(invalid_files) > 0:
-		exception_messages = [e[1].format(im.join_list(e[0], '\n')) for e in invalid_files]
+		exception_messages = [e[1].format(im.join_list(report_files(e[0]), '\n')) for e in invalid_files]
 		sys.exit(im.join_list(exception_messages, '\n'))
 	# Save file paths to output file
 	else:
@@ -1148,13 +1182,12 @@ def validate_input_dir(input_path, output_file):
 	SystemExit
 		- If there are no valid FASTA files in the input directory.
 	"""
-	# List absolute paths
-	# Only keep paths to files
-	files = [file for file in fo.listdir_fullpath(input_path)
-			 if os.path.isdir(file) is False]
-
-	# Filter based on file extension
-	valid_extension, invalid_extension = fo.filter_by_extension(files, ct.FASTA_EXTENSIONS)
+	# List paths to files that end with one of the accepted extensions
+	# Directory entries cache the file type, no need to stat each path
+	with os.scandir(input_path) as entries:
+		valid_extension = [entry.path for entry in entries
+						   if entry.is_dir() is False
+						   and entry.name.endswith(ct.FASTA_EXTENSIONS)]
 
 	# Only keep files whose content is typical of a FASTA file
 	fasta_files, non_fasta = fao.filter_non_fasta(valid_extension)
@@ -1202,38 +1235,39 @@ def validate_loci_list(input_path, output_file, parent_dir=None):
 		sys.exit(ct.FASTA_LOCI_LIST_EXCEPTION)
 
 	# Read list of input files
-	files = [line[0] for line in fo.read_tabular(input_path)]
+	files = fo.read_path_list(input_path)
 
 	# List must have full paths
 	if parent_dir is not None:
 		# Add parent directory path if necessary
-		files = [os.path.join(parent_dir, fo.file_basename(file))
-				 if parent_dir not in file
-				 else file
+		parent_prefix = os.path.join(parent_dir, '')
+		files = [file if parent_dir in file
+				 else parent_prefix + os.path.basename(file)
 				 for file in files]
 
 	# Add '.fasta' extension if it is missing from IDs
 	# Loci files use the '.fasta' extension, anything else might
 	# mean there is an issue with the schema or it is an external schema
-	files = [file+'.fasta'
-			 if any([file.endswith(ext) for ext in ct.FASTA_EXTENSIONS]) is False
-			 else file
+	files = [file if file.endswith(ct.FASTA_EXTENSIONS) else file+'.fasta'
 			 for file in files]
 
 	# Check that all files exist
 	invalid_files = []
-	missing = [file for file in files if os.path.exists(file) is False]
+	missing = fo.missing_files(files)
 	if len(missing) > 0:
 		invalid_files.append([missing, ct.MISSING_LOCI_EXCEPTION])
 
 	# Only keep files whose content is typical of a FASTA file
-	fasta_files, non_fasta = fao.filter_non_fasta(files)
+	# Missing files were already reported and cannot be read
+	missing = set(missing)
+	fasta_files, non_fasta = fao.filter_non_fasta([file for file in files
+												   if file not in missing])
 	if len(non_fasta) > 0:
 		invalid_files.append([non_fasta, ct.NON_FASTA_LOCI_EXCEPTION])
 
 	# Exit if list of input files contained invalid files
 	if len(invalid_files) > 0:
-		exception_messages = [e[1].format(im.join_list(e[0], '\n')) for e in invalid_files]
+		exception_messages = [e[1].format(im.join_list(report_files(e[0]), '\n')) for e in invalid_files]
 		sys.exit(im.join_list(exception_messages, '\n'))
 	# Save file paths to output file
 	else:
@@ -1259,12 +1293,109 @@ def get_file_prefixes(path_list):
 	basenames = [fo.file_basename(file) for file in path_list]
 	prefixes = {}
 	for name in basenames:
-		prefix = fo.split_joiner(name, [0], '.')
-		prefixes.setdefault(prefix, []).append(name)
+		# Prefix is the substring before the first '.'
+		prefixes.setdefault(name.partition('.')[0], []).append(name)
 
 	return prefixes
 
 
+def shared_prefixes(prefixes, total_inputs):
+	"""Exit if multiple input files share the same prefix.
+
+	Parameters
+	----------
+	prefixes : dict
+		Dictionary with file prefixes as keys and file basenames
+		as values (returned by `get_file_prefixes`).
+	total_inputs : int
+		Number of input files.
+
+	Raises
+	------
+	SystemExit
+		- If there are multiple files sharing the same prefix.
+	"""
+	if len(prefixes) < total_inputs:
+		repeated_basenames = [v for k, v in prefixes.items() if len(v) > 1]
+		repeated_basenames = [','.join(l) for l in repeated_basenames]
+		sys.exit(ct.INPUTS_SHARE_PREFIX.format('\n'.join(repeated_basenames)))
+
+
+def blank_basenames(basenames):
+	"""Exit if any file basename includes blank spaces.
+
+	Parameters
+	----------
+	basenames : list
+		List with file basenames.
+
+	Raises
+	------
+	SystemExit
+		- If there are blank spaces in any of the filenames.
+	"""
+	include_blanks = [name for name in basenames if ' ' in name]
+	if len(include_blanks) > 0:
+		sys.exit(ct.INPUTS_INCLUDE_BLANKS.format('\n'.join(include_blanks)))
+
+
+def long_prefixes(prefixes):
+	"""Exit if any file prefix is longer than `ct.PREFIX_MAXLEN` characters.
+
+	Parameters
+	----------
+	prefixes : dict
+		Dictionary with file prefixes as keys and file basenames
+		as values (returned by `get_file_prefixes`).
+
+	Raises
+	------
+	SystemExit
+		- If any input file has a unique identifier with more
+		than `ct.PREFIX_MAXLEN` characters.
+	"""
+	too_long = {k: v for k, v in prefixes.items() if len(k) > ct.PREFIX_MAXLEN}
+	if len(too_long) > 0:
+		long_prefixes_msg = [f'{v[0]} ({k}, {len(k)} chars)' for k, v in too_long.items()]
+		long_prefixes_msg = '\n'.join(long_prefixes_msg)
+		sys.exit(ct.INPUTS_LONG_PREFIX.format(long_prefixes_msg))
+
+
+def validate_input_list(input_list):
+	"""Validate the basenames of the input files in a list of paths.
+
+	Reads the list of paths once and checks that file prefixes are
+	unique, that basenames do not include blank spaces and that
+	prefixes are not longer than `ct.PREFIX_MAXLEN` characters.
+
+	Parameters
+	----------
+	input_list : str
+		Path to file that contains the list of paths to input files.
+
+	Returns
+	-------
+	False if all input files passed the checks.
+
+	Raises
+	------
+	SystemExit
+		- If there are multiple files sharing the same prefix.
+		- If there are blank spaces in any of the filenames.
+		- If any input file has a unique identifier with more
+		than `ct.PREFIX_MAXLEN` characters.
+	"""
+	input_paths = fo.read_lines(input_list)
+	basenames = [fo.file_basename(file) for file in input_paths]
+	prefixes = get_file_prefixes(basenames)
+
+	shared_prefixes(prefixes, len(input_paths))
+	blank_basenames(basenames)
+	long_prefixes(prefixes)
+
+	return False
+
+
 def check_unique_prefixes(input_list):
 	"""Check if all input files have an unique identifier.
 
@@ -1283,13 +1414,7 @@ def check_unique_prefixes(input_list):
 		- If there are multiple files sharing the same prefix.
 	"""
 	input_paths = fo.read_lines(input_list)
-	prefixes = get_file_prefixes(input_paths)
-
-	# Detect if some inputs share the same unique prefix
-	if len(set(prefixes)) < len(input_paths):
-		repeated_basenames = [v for k, v in prefixes.items() if len(v) > 1]
-		repeated_basenames = [','.join(l) for l in repeated_basenames]
-		sys.exit(ct.INPUTS_SHARE_PREFIX.format('\n'.join(repeated_basenames)))
+	shared_prefixes(get_file_prefixes(input_paths), len(input_paths))
 
 	return False
 
@@ -1312,11 +1437,7 @@ def check_blanks(input_list):
 		- If there are blank spaces in any of the filenames.
 	"""
 	input_paths = fo.read_lines(input_list)
-	basenames = [fo.file_basename(file) for file in input_paths]
-	include_blanks = [name for name in basenames if ' ' in name]
-
-	if len(include_blanks) > 0:
-		sys.exit(ct.INPUTS_INCLUDE_BLANKS.format('\n'.join(include_blanks)))
+	blank_basenames([fo.file_basename(file) for file in input_paths])
 
 	return False
 
@@ -1340,12 +1461,6 @@ def check_prefix_length(input_list):
 		- If any input file has a unique identifier with more than 30 characters.
 	"""
 	input_paths = fo.read_lines(input_list)
-	prefixes = get_file_prefixes(input_paths)
-	long_prefixes = {k: v for k, v in prefixes.items() if len(k) > ct.PREFIX_MAXLEN}
-	# Exit if any file prefix is longer than 30 characters
-	if len(long_prefixes) > 0:
-		long_prefixes_msg = [f'{v[0]} ({k}, {len(k)} chars)' for k, v in long_prefixes.items()]
-		long_prefixes_msg = '\n'.join(long_prefixes_msg)
-		sys.exit(ct.INPUTS_LONG_PREFIX.format(long_prefixes_msg))
+	long_prefixes(get_file_prefixes(input_paths))
 
 	return False
@@ -12,7 +12,9 @@ Code documentation
 """
 
 
+import os
 import sys
+import time
 import functools
 import datetime as dt
 
@@ -130,6 +132,11 @@ def process_header(process):
 
 # Decorator to time main processes
 def process_timer(func):
+    # Do not wrap the function if users do not want the header and
+    # timing information (e.g. pipelines that run chewBBACA many times)
+    if os.environ.get('CHEWBBACA_NO_TIMING') == '1':
+        return func
+
     # Use functools to preserve info about wrapped function
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -141,16 +148,19 @@ def process_timer(func):
             start = get_datetime()
             start_str = datetime_str(start)
             print(f'Started at: {start_str}\n')
+            # Monotonic counter is not affected by system clock changes
+            start_ns = time.perf_counter_ns()
 
         # Run function
         func(*args, **kwargs)
 
         # Does not print elapsed time if the help message is printed
+        end_ns = time.perf_counter_ns()
         end = get_datetime()
         end_str = datetime_str(end)
         print(f'\nFinished at: {end_str}')
 
-        minutes, seconds = datetime_diff(start, end)
+        minutes, seconds = divmod((end_ns - start_ns) / 1e9, 60)
         print(f'Took {minutes: .0f}m{seconds: .0f}s.')
 
     return wrapper
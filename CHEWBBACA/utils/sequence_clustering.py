@@ -124,17 +124,23 @@ def intra_cluster_sim(clusters, sequences, word_size, intra_filter):
         clustered_ids = [c[0] for c in clustered]
         clustered_seqs = {seqid: sequences[seqid] for seqid in clustered_ids}
 
+        # determine minimizers only once, to create the kmer index
+        # and to query it with each sequence in the cluster
+        clustered_kmers = {seqid: im.determine_minimizers(sequence, word_size,
+                                                          word_size, position=False)
+                           for seqid, sequence in clustered_seqs.items()}
+
         # create kmer index
-        kmers_mapping = im.kmer_index(clustered_seqs, word_size, fasta=False)
+        kmers_mapping = {}
+        for seqid, minimizers in clustered_kmers.items():
+            for kmer in set(minimizers):
+                kmers_mapping.setdefault(kmer, []).append(seqid)
 
-        excluded = []
+        excluded = set()
         similarities = []
         # for each sequence in the cluster
-        for seqid, sequence in clustered_seqs.items():
+        for seqid, query_kmers in clustered_kmers.items():
             if seqid not in excluded:
-                query_kmers = im.determine_minimizers(sequence, word_size,
-                                                      word_size, position=False)
-
                 # select sequences with same kmers
                 sims = select_representatives(query_kmers,
                                               kmers_mapping,
@@ -151,10 +157,9 @@ def intra_cluster_sim(clusters, sequences, word_size, intra_filter):
                         elif len(clustered_seqs[c[0]]) > len(clustered_seqs[seqid]):
                             picked = (seqid, c[0], c[1])
                         similarities.append(picked)
-                        excluded.append(picked[0])
+                        excluded.add(picked[0])
 
-        # convert into set first to remove possible duplicates
-        excluded_seqids[representative] = list(set(excluded))
+        excluded_seqids[representative] = list(excluded)
         excluded_sims[representative] = similarities
 
     return [excluded_seqids, excluded_sims]
@@ -364,22 +369,15 @@ def write_clusters(clusters, outfile):
         Path to the file that will be created to save
         information about clusters.
     """
-    cluster_lines = []
-    for rep, seqids in clusters.items():
-        current_cluster = []
-        current_cluster.append('>{0}'.format(rep))
-        clustered = [', '.join(['{}']*len(s)).format(*s)
-                     for s in seqids]
-        current_cluster.extend(clustered)
-        cluster_lines.append(current_cluster)
-
-    # sort by number of lines to get clusters with more sequences first
-    cluster_lines = im.sort_iterable(cluster_lines,
-                                     sort_key=lambda x: len(x), reverse=True)
-    cluster_lines = im.flatten_list(cluster_lines)
-    cluster_text = im.join_list(cluster_lines, '\n')
+    # sort by number of sequences to get clusters with more sequences first
+    sorted_clusters = im.sort_iterable(clusters.items(),
+                                       sort_key=lambda x: len(x[1]), reverse=True)
 
-    fo.write_to_file(cluster_text, outfile, 'w', '\n')
+    # write lines as they are created instead of joining all lines
+    with open(outfile, 'w') as out:
+        for rep, seqids in sorted_clusters:
+            out.write('>{0}\n'.format(rep))
+            out.writelines(', '.join(map(str, s))+'\n' for s in seqids)
 
 
 def representative_pruner(clusters, sim_cutoff):
@@ -415,13 +413,15 @@ def representative_pruner(clusters, sim_cutoff):
     excluded = []
     pruned_clusters = {}
     for rep, seqids in clusters.items():
-        pruned_clusters[rep] = [seqid
-                                for seqid in seqids
-                                if seqid[1] < sim_cutoff]
-        # do not exclude cluster representatives
-        excluded.extend([seqid
-                         for seqid in seqids
-                         if seqid[1] >= sim_cutoff and seqid[0] != rep])
+        # split clustered sequences in a single pass
+        kept = []
+        for seqid in seqids:
+            if seqid[1] < sim_cutoff:
+                kept.append(seqid)
+            # do not exclude cluster representatives
+            elif seqid[0] != rep:
+                excluded.append(seqid)
+        pruned_clusters[rep] = kept
 
     return [pruned_clusters, excluded]
 
@@ -586,7 +586,7 @@ def determine_small(sequences_file, minimum_length, variation=0):
     return small_seqids
 
 
-def apply_bsr(blast_results, fasta_file, bsr):
+def apply_bsr(blast_results, sequence_lengths, bsr):
     """Find similar sequences based on the BLAST Score Ratio.
 
     Parameters
@@ -594,9 +594,10 @@ def apply_bsr(blast_results, fasta_file, bsr):
     blast_results : list
         List with the path to a file with BLAST
         results in tabular format.
-    fasta_file : str
-        Path to a FASTA file that contains the
-        sequences that were aligned.
+    sequence_lengths : dict
+        Dictionary with sequence identifiers as keys
+        and the length of the sequences that were
+        aligned as values.
     bsr : float
         The BSR value to use as threshold
 
@@ -610,15 +611,11 @@ def apply_bsr(blast_results, fasta_file, bsr):
     self_scores = {r[0]: r[-1] for r in blast_results if r[0] == r[4]}
     blast_results = [r for r in blast_results if r[0] != r[4]]
 
-    # Determine sequence lengths
-    lengths = {}
-    for k in self_scores:
-        record = fasta_file.get(k)
-        sequence = str(record.seq)
-        lengths[k] = len(sequence)
+    # Get length of sequences with self-score
+    lengths = {k: sequence_lengths[k] for k in self_scores}
 
     # Exclude based on BSR
-    excluded_alleles = []
+    excluded_alleles = set()
     for result in blast_results:
         query = result[0]
         target = result[4]
@@ -635,13 +632,13 @@ def apply_bsr(blast_results, fasta_file, bsr):
                 if blast_score_ratio >= bsr and target not in excluded_alleles:
                     # Exclude query if target is bigger
                     if target_length > query_length and query not in excluded_alleles:
-                        excluded_alleles.append(query)
+                        excluded_alleles.add(query)
                     # Exclude target if query is bigger
                     elif target_length <= query_length:
-                        excluded_alleles.append(target)
+                        excluded_alleles.add(target)
             # It might not be possible to determine the self-score for some sequences
             # This might be related with composition-based stats being enabled
             except Exception:
-                excluded_alleles.append(query)
+                excluded_alleles.add(query)
 
-    return excluded_alleles
+    return list(excluded_alleles)